@@ -1,97 +1,221 @@
 """MCP CalDAV Server - Calendar integration for MCP."""
 
+import argparse
 import asyncio
+import functools
+import importlib
 import logging
 import os
-
-import click
-from dotenv import load_dotenv
+import signal
+import sys
+from collections.abc import Sequence
+from types import ModuleType
 
 __version__ = "0.1.0"
 
+# Accepted values for boolean environment flags, compared case-insensitively
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def _env_flag(name: str) -> bool:
+    """Return whether a boolean environment flag is set to a true value."""
+    return os.environ.get(name, "").strip().lower() in _TRUTHY
+
+
 # Initialize logging
-logging_level = logging.WARNING
-if os.getenv("MCP_VERBOSE", "").lower() in ("true", "1", "yes"):
-    logging_level = logging.DEBUG
-
-logging.basicConfig(
-    level=logging_level,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+logging_level = logging.DEBUG if _env_flag("MCP_VERBOSE") else logging.WARNING
+
 logger = logging.getLogger("mcp-caldav")
 
+# Log level for each -v count (none, -v, -vv)
+_LEVELS = (logging.WARNING, logging.INFO, logging.DEBUG)
+
+# Root handler installed by the CLI, built once per process
+_FMT = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_HANDLER = logging.StreamHandler()
+_HANDLER.setFormatter(_FMT)
+
+# Parsed .env files keyed by path, with the mtime they were parsed at
+_DOTENV_CACHE: dict[str, tuple[float, dict[str, str]]] = {}
+_default_dotenv_path: str | None = None
+
+# The server module, imported on first use by main()
+_server_mod: ModuleType | None = None
+
+
+def _find_default_dotenv() -> str:
+    """Locate the default .env file once per process.
+
+    Returns an empty path when python-dotenv is not installed, so deployments
+    that inject their environment directly skip .env handling entirely.
+    """
+    global _default_dotenv_path
+    if _default_dotenv_path is None:
+        try:
+            from dotenv import find_dotenv
+        except ImportError:
+            _default_dotenv_path = ""
+        else:
+            # Called from this module, like load_dotenv() used to be, so the
+            # search starts from the package directory rather than the cwd
+            _default_dotenv_path = find_dotenv()
+    return _default_dotenv_path
+
+
+def _load_dotenv_cached(path: str) -> None:
+    """Load a .env file into os.environ without overriding existing values.
+
+    The parsed contents are cached by (path, mtime) so repeated loads of an
+    unchanged file skip the parser. Raises ImportError if python-dotenv is
+    not installed.
+    """
+    if not path:
+        return
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return
+
+    cached = _DOTENV_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        values = cached[1]
+    else:
+        from dotenv import dotenv_values
 
-@click.command()
-@click.option(
-    "-v",
-    "--verbose",
-    count=True,
-    help="Increase verbosity (can be used multiple times)",
-)
-@click.option(
-    "--env-file",
-    type=click.Path(exists=True, dir_okay=False),
-    help="Path to .env file",
-)
-@click.option(
-    "--transport",
-    type=click.Choice(["stdio", "sse"]),
-    default="stdio",
-    help="Transport type (stdio or sse)",
-)
-@click.option(
-    "--port",
-    default=8000,
-    help="Port to listen on for SSE transport",
-)
-@click.option(
-    "--caldav-url",
-    help="CalDAV server URL (e.g., https://caldav.example.com/)",
-)
-@click.option("--caldav-username", help="CalDAV username")
-@click.option("--caldav-password", help="CalDAV password or app password")
-def main(
-    verbose: bool,
-    env_file: str | None,
-    transport: str,
-    port: int,
-    caldav_url: str | None,
-    caldav_username: str | None,
-    caldav_password: str | None,
-) -> None:
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        _DOTENV_CACHE[path] = (mtime, values)
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+def _existing_file(value: str) -> str:
+    """Argparse type that accepts only paths to existing files."""
+    if not os.path.isfile(value):
+        raise argparse.ArgumentTypeError(f"File '{value}' does not exist.")
+    return value
+
+
+async def _serve(server: ModuleType, transport: str, port: int) -> None:
+    """Run the server until it returns or the process is asked to stop.
+
+    SIGINT and SIGTERM cancel the serving task, so the server lifespan
+    unwinds and closes the CalDAV connection pool instead of the process
+    dying with sockets still open.
+    """
+    task = asyncio.current_task()
+    if sys.platform != "win32" and task is not None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, task.cancel)
+
+    try:
+        await server.run_server(transport=transport, port=port)
+    except asyncio.CancelledError:
+        logger.info("Server stopped")
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once per process."""
+    parser = argparse.ArgumentParser(
+        prog="mcp-caldav",
+        description=(
+            "MCP CalDAV Server - Universal calendar functionality for MCP. "
+            "Works with any CalDAV-compatible calendar server."
+        ),
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Increase verbosity (can be used multiple times)",
+    )
+    parser.add_argument(
+        "--env-file",
+        type=_existing_file,
+        help="Path to .env file",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "sse"],
+        default="stdio",
+        help="Transport type (stdio or sse)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on for SSE transport",
+    )
+    parser.add_argument(
+        "--caldav-url",
+        help="CalDAV server URL (e.g., https://caldav.example.com/)",
+    )
+    parser.add_argument("--caldav-username", help="CalDAV username")
+    parser.add_argument("--caldav-password", help="CalDAV password or app password")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
     """MCP CalDAV Server - Universal calendar functionality for MCP
 
     Works with any CalDAV-compatible calendar server.
     """
-    # Configure logging based on verbosity
-    logging_level = logging.WARNING
-    if verbose == 1:
-        logging_level = logging.INFO
-    elif verbose >= 2:
-        logging_level = logging.DEBUG
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    # Install a root handler unless the host application already did
+    root = logging.getLogger()
+    if not root.hasHandlers():
+        root.addHandler(_HANDLER)
+        root.setLevel(logging_level)
 
-    logging.getLogger("mcp-caldav").setLevel(logging_level)
+    # Configure logging based on verbosity
+    logger.setLevel(_LEVELS[min(args.verbose, 2)])
+
+    # Set environment variables from command line arguments if provided.
+    # .env values never override existing variables, so applying these
+    # first keeps the command line authoritative.
+    env = os.environ
+    cli_settings = [
+        (k, v)
+        for k, v in (
+            ("CALDAV_URL", args.caldav_url),
+            ("CALDAV_USERNAME", args.caldav_username),
+            ("CALDAV_PASSWORD", args.caldav_password),
+        )
+        if v
+    ]
+    if cli_settings:
+        env.update(cli_settings)
 
     # Load environment variables from file if specified
-    if env_file:
-        logger.debug(f"Loading environment from file: {env_file}")
-        load_dotenv(env_file)
+    if args.env_file:
+        logger.debug("Loading environment from file: %s", args.env_file)
+        try:
+            _load_dotenv_cached(args.env_file)
+        except ImportError:
+            parser.error(
+                "python-dotenv not installed; install with pip install python-dotenv"
+            )
     else:
         logger.debug("Attempting to load environment from default .env file")
-        load_dotenv()
-
-    # Set environment variables from command line arguments if provided
-    if caldav_url:
-        os.environ["CALDAV_URL"] = caldav_url
-    if caldav_username:
-        os.environ["CALDAV_USERNAME"] = caldav_username
-    if caldav_password:
-        os.environ["CALDAV_PASSWORD"] = caldav_password
-
-    from . import server
-
-    # Run the server with specified transport
-    asyncio.run(server.run_server(transport=transport, port=port))
+        _load_dotenv_cached(_find_default_dotenv())
+
+    global _server_mod
+    if _server_mod is None:
+        _server_mod = importlib.import_module(".server", __name__)
+    server = _server_mod
+
+    # Run the server with specified transport, on uvloop when installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_serve(server, args.transport, args.port))
+    else:
+        uvloop.run(_serve(server, args.transport, args.port))
 
 
 __all__ = ["__version__", "main", "server"]
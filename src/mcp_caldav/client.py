@@ -1,17 +1,52 @@
 """CalDAV client for calendar operations."""
 
-from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING, Any, TypedDict
+import contextlib
+import hashlib
+import heapq
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from operator import itemgetter
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
 
 if TYPE_CHECKING:
-    import caldav
+    from collections.abc import Callable
 
-try:
-    import caldav
-except ImportError as err:
-    raise ImportError(
-        "caldav library is not installed. Install it with: pip install caldav"
-    ) from err
+logger = logging.getLogger("mcp-caldav")
+
+# caldav (and icalendar with it) is only imported once connect() is first
+# called, since it pulls in an HTTP stack and lxml
+_CALDAV_MISSING = "caldav library is not installed. Install it with: pip install caldav"
+
+
+class _DAVErrorPlaceholder(Exception):
+    """Stands in for caldav's DAVError until the library is imported."""
+
+
+# caldav's base error class, bound by _import_caldav()
+DAVError: type[Exception] = _DAVErrorPlaceholder
+
+
+def _import_caldav() -> Any:
+    """Import the caldav library, binding DAVError to its real class."""
+    global DAVError
+    try:
+        import caldav
+        from caldav.lib.error import DAVError as dav_error
+    except ImportError as err:
+        raise ImportError(_CALDAV_MISSING) from err
+    DAVError = dav_error
+    return caldav
 
 
 class CalendarInfo(TypedDict):
@@ -57,18 +92,146 @@ class EventDeletionResult(TypedDict):
 
 AttendeeInput = EventAttendee | str
 
+# (start, end, record, search texts) with naive wall-clock start/end used for
+# ordering; the search texts are lowercased in _SEARCH_TEXT_FIELDS order
+_EventEntry = tuple[datetime, datetime, EventRecord, tuple[str, str, str, str]]
+
+# Upper bound on calendars queried concurrently by get_events_multi
+_MAX_FETCH_WORKERS = 8
+
+# Connection pool sizing for the CalDAV HTTP session. A single tool call can
+# issue several WebDAV requests against the same host, so keep a handful of
+# connections alive and retry transient connection failures. The pool holds
+# one connection per fetch worker plus the calling thread and a background
+# refresh, so concurrent queries never discard a connection (and later pay
+# for a new TLS handshake) because the pool was full.
+_POOL_CONNECTIONS = 1
+_POOL_MAXSIZE = _MAX_FETCH_WORKERS + 2
+_MAX_RETRIES = 2
+
+# Seconds to wait on a single HTTP request before giving up, so a stalled
+# server can't hang a tool call (and a pooled connection) forever. Generous,
+# since Yandex deliberately throttles WebDAV transfers.
+_REQUEST_TIMEOUT = 120
+
+# Accepted RRULE frequencies, attendee participation statuses and alarm actions
+_VALID_FREQ = frozenset({"DAILY", "WEEKLY", "MONTHLY", "YEARLY"})
+_VALID_PARTSTAT = frozenset({"ACCEPTED", "DECLINED", "TENTATIVE", "NEEDS-ACTION"})
+_VALID_ALARM_ACTIONS = frozenset({"DISPLAY", "EMAIL", "AUDIO"})
+
+# iCalendar properties matched server-side for the searchable text fields.
+# ATTENDEE is left out: its values are mailto: URIs, so attendee searches
+# filter the cached window instead.
+_TEXT_MATCH_PROPS = {
+    "title": "SUMMARY",
+    "description": "DESCRIPTION",
+    "location": "LOCATION",
+}
+
+# RFC 4791 collation for the text-match prefilter. caldav's own summary=/
+# location= parameters use i;octet, which servers match case-sensitively.
+# i;ascii-casemap folds ASCII letters only, so search_events sends only
+# ASCII queries and matches the rest client-side over the whole window.
+_TEXT_MATCH_COLLATION = "i;ascii-casemap"
+
+# Seconds get_events results are reused, including for narrower windows.
+# Up to the stale TTL an exact window is still served while it refreshes.
+_EVENTS_TTL = 30.0
+_EVENTS_STALE_TTL = 300.0
+
+# Fields search_events looks in when the caller doesn't restrict them
+_SEARCH_FIELDS = frozenset({"title", "description", "location", "attendees"})
+
+# Order of the lowercased search texts kept with each cached event entry
+_SEARCH_TEXT_FIELDS = ("title", "description", "location", "attendees")
+
+# Seconds to reuse the principal's calendar list before issuing a new PROPFIND.
+# Failed operations drop the cached list, so a stale one is not kept around.
+_CALENDARS_TTL = 300.0
+
+# Seconds an event window saved to the on-disk cache may be served after a
+# restart. Such windows are always revalidated in the background first.
+_DISK_CACHE_MAX_AGE = 86400.0
+
+# Names of the files _save_window writes: calendar key, then window hash.
+# Only these are ever pruned, since the cache directory is user-chosen.
+_DISK_CACHE_NAME = re.compile(r"[0-9a-f]{16}-[0-9a-f]{64}\.json")
+
+
+# Fixed content lines wrapping the VEVENT built by create_event
+_VCAL_HEADER = (
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//CalDAV MCP Server//Python//EN",
+    "CALSCALE:GREGORIAN",
+    "BEGIN:VEVENT",
+)
+_VCAL_FOOTER = ("END:VEVENT", "END:VCALENDAR")
+
+# Maximum octets per physical iCalendar line, excluding the CRLF
+_FOLD_OCTETS = 75
+
+# Times and durations used when parsing every event, built once
+_MIN_TIME = datetime.min.time()
+_END_OF_DAY_ISO = "T" + datetime.max.time().isoformat()
+_ONE_HOUR = timedelta(hours=1)
+_ONE_DAY = timedelta(days=1)
+
+# Characters that must be escaped in iCalendar TEXT values (RFC 5545 3.3.11).
+# Bare CRs are dropped so CRLF line breaks become a single escaped newline.
+_ICAL_ESCAPE_RE = re.compile(r"[\\\r\n,;]")
+_ICAL_ESCAPE_MAP = {"\\": "\\\\", "\r": "", "\n": "\\n", ",": "\\,", ";": "\\;"}
+
 
 def _escape_ical_text(value: str | Any) -> str:
     """Escape text for inclusion in iCalendar payloads."""
     if not isinstance(value, str):
         value = str(value)
-    result: str = (
-        value.replace("\\", "\\\\")
-        .replace("\n", "\\n")
-        .replace(",", "\\,")
-        .replace(";", "\\;")
+    return _ICAL_ESCAPE_RE.sub(lambda m: _ICAL_ESCAPE_MAP[m.group(0)], value)
+
+
+def _fold_ical_line(line: str) -> str:
+    """
+    Fold a content line to at most 75 octets per physical line (RFC 5545 3.1).
+
+    Continuation lines start with a single space, and UTF-8 sequences are
+    never split.
+    """
+    if len(line) <= _FOLD_OCTETS and line.isascii():
+        return line
+    data = line.encode("utf-8")
+    if len(data) <= _FOLD_OCTETS:
+        return line
+
+    parts = []
+    start = 0
+    limit = _FOLD_OCTETS
+    while start < len(data):
+        end = min(start + limit, len(data))
+        # Back up to the start of a UTF-8 sequence
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        start = end
+        # The leading space of a continuation line counts towards the limit
+        limit = _FOLD_OCTETS - 1
+    return "\r\n ".join(parts)
+
+
+def _fmt_ical_local(dt: datetime) -> str:
+    """Format a datetime as an iCalendar local (floating) DATE-TIME."""
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+        f"T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
     )
-    return result
+
+
+def _fmt_ical_utc(dt: datetime) -> str:
+    """Format a datetime as an iCalendar UTC DATE-TIME.
+
+    The value is written as-is with a Z suffix; callers pass UTC times.
+    """
+    return f"{_fmt_ical_local(dt)}Z"
 
 
 def _format_rrule(recurrence: dict) -> str:
@@ -92,7 +255,7 @@ def _format_rrule(recurrence: dict) -> str:
         return ""
 
     frequency = recurrence.get("frequency", "DAILY").upper()
-    if frequency not in ["DAILY", "WEEKLY", "MONTHLY", "YEARLY"]:
+    if frequency not in _VALID_FREQ:
         raise ValueError(f"Invalid frequency: {frequency}")
 
     parts = [f"FREQ={frequency}"]
@@ -108,9 +271,9 @@ def _format_rrule(recurrence: dict) -> str:
     until = recurrence.get("until")
     if until:
         if isinstance(until, datetime):
-            until_str = until.strftime("%Y%m%dT%H%M%SZ")
+            until_str = _fmt_ical_utc(until)
         elif isinstance(until, date):
-            until_str = until.strftime("%Y%m%d")
+            until_str = f"{until.year:04d}{until.month:02d}{until.day:02d}"
         else:
             until_str = str(until)
         parts.append(f"UNTIL={until_str}")
@@ -142,9 +305,8 @@ def _format_categories(categories: list[str]) -> str:
     """
     if not categories:
         return ""
-    # Escape commas in categories and join with commas
-    escaped = [cat.replace(",", "\\,").replace(";", "\\;") for cat in categories]
-    return f"CATEGORIES:{','.join(escaped)}"
+    # Escape each category as TEXT and join with commas
+    return f"CATEGORIES:{','.join(map(_escape_ical_text, categories))}"
 
 
 def _format_attendees(attendees: list[AttendeeInput]) -> str:
@@ -156,11 +318,15 @@ def _format_attendees(attendees: list[AttendeeInput]) -> str:
             Status can be: 'ACCEPTED', 'DECLINED', 'TENTATIVE', 'NEEDS-ACTION'
 
     Returns:
-        ATTENDEE lines for iCalendar
+        Folded ATTENDEE lines for iCalendar, separated by CRLF
     """
     if not attendees:
         return ""
+    return "\r\n".join(map(_fold_ical_line, _attendee_lines(attendees)))
 
+
+def _attendee_lines(attendees: list[AttendeeInput]) -> list[str]:
+    """Build one unfolded ATTENDEE content line per valid attendee."""
     attendee_lines = []
     for attendee in attendees:
         display_name = ""
@@ -181,13 +347,23 @@ def _format_attendees(attendees: list[AttendeeInput]) -> str:
         # Build ATTENDEE line
         cn_value = _escape_ical_text(display_name or email)
         params = ["RSVP=TRUE", f"CN={cn_value}"]
-        if status and status in ["ACCEPTED", "DECLINED", "TENTATIVE", "NEEDS-ACTION"]:
+        if status in _VALID_PARTSTAT:
             params.append(f"PARTSTAT={status}")
 
         attendee_line = f"ATTENDEE;{';'.join(params)}:mailto:{email}"
         attendee_lines.append(attendee_line)
 
-    return "\n".join(attendee_lines) + "\n" if attendee_lines else ""
+    return attendee_lines
+
+
+def _category_value(cat: Any) -> str:
+    """Return the text of a single category value."""
+    if isinstance(cat, str):
+        return str(cat)
+    value = getattr(cat, "value", cat)
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
 
 
 def _parse_categories(cats: Any) -> list[str]:
@@ -203,38 +379,30 @@ def _parse_categories(cats: Any) -> list[str]:
     if not cats:
         return []
 
-    categories = []
+    categories: list[str] = []
     try:
-        # Handle vText objects or lists
-        if hasattr(cats, "cats"):
-            # Multiple categories as list
-            for cat in cats.cats:
-                if hasattr(cat, "value"):
-                    categories.append(str(cat.value))
-                else:
-                    categories.append(str(cat))
-        elif hasattr(cats, "value"):
-            # Single category as vText
-            value = cats.value
-            if isinstance(value, bytes):
-                value = value.decode("utf-8")
-            categories = [c.strip() for c in str(value).split(",")]
-        elif isinstance(cats, list):
-            # List of category objects
+        if isinstance(cats, str):
+            # Plain or vText string
+            categories = [c.strip() for c in cats.split(",")]
+        elif isinstance(cats, bytes):
+            categories = [c.strip() for c in cats.decode("utf-8").split(",")]
+        elif isinstance(cats, (list, tuple)):
+            # Repeated CATEGORIES properties or a list of category values
             for cat in cats:
-                if hasattr(cat, "value"):
-                    val = cat.value
-                    if isinstance(val, bytes):
-                        val = val.decode("utf-8")
-                    categories.append(str(val))
+                inner = getattr(cat, "cats", None)
+                if inner is not None:
+                    # icalendar vCategory
+                    categories.extend(map(_category_value, inner))
                 else:
-                    categories.append(str(cat))
+                    categories.append(_category_value(cat))
         else:
-            # String format
-            cat_str = str(cats)
-            if isinstance(cats, bytes):
-                cat_str = cats.decode("utf-8")
-            categories = [c.strip() for c in cat_str.split(",")]
+            # A single CATEGORIES property (icalendar vCategory) or another
+            # object exposing the same interface
+            inner = getattr(cats, "cats", None)
+            if inner is not None:
+                categories = [_category_value(cat) for cat in inner]
+            else:
+                categories = [c.strip() for c in str(cats).split(",")]
     except Exception:
         # Fallback: try to convert to string
         try:
@@ -245,6 +413,32 @@ def _parse_categories(cats: Any) -> list[str]:
     return [c for c in categories if c]
 
 
+def _recur_text(rrule: Any) -> str:
+    """
+    Return the RRULE value text of a parsed recurrence rule.
+
+    vRecur is a dict of value lists, so plain values are joined directly
+    in their original order instead of round-tripping through to_ical();
+    dates and other typed values (e.g. UNTIL) still use its formatting.
+    """
+    if isinstance(rrule, str):
+        return rrule
+    parts: list[str] = []
+    for key, values in rrule.items():
+        if not isinstance(values, list):
+            values = [values]
+        if not all(isinstance(value, (str, int)) for value in values):
+            text: str = rrule.to_ical().decode()
+            return text
+        parts.append(f"{key}={','.join(map(str, values))}")
+    return ";".join(parts)
+
+
+def _strip_mailto(address: str) -> str:
+    """Drop a leading mailto: scheme, in any case, from a calendar address."""
+    return address[7:] if address[:7].lower() == "mailto:" else address
+
+
 def _parse_attendees(ical_component: Any) -> list[EventAttendee]:
     """
     Parse attendees from iCalendar component.
@@ -262,17 +456,17 @@ def _parse_attendees(ical_component: Any) -> list[EventAttendee]:
 
     for attendee in attendee_list:
         try:
-            if hasattr(attendee, "params"):
-                email = str(attendee).replace("mailto:", "")
-                status = (
-                    attendee.params.get("PARTSTAT", ["NEEDS-ACTION"])[0]
-                    if hasattr(attendee, "params")
-                    else "NEEDS-ACTION"
-                )
+            params = getattr(attendee, "params", None)
+            if params is not None:
+                email = _strip_mailto(str(attendee))
+                # icalendar gives a string; a list is accepted for safety
+                status = params.get("PARTSTAT", "NEEDS-ACTION")
+                if not isinstance(status, str):
+                    status = status[0]
                 attendees.append({"email": email, "status": status})
             else:
                 # Fallback for string format
-                email = str(attendee).replace("mailto:", "").strip()
+                email = _strip_mailto(str(attendee).strip())
                 if email:
                     attendees.append({"email": email, "status": "NEEDS-ACTION"})
         except Exception:
@@ -281,6 +475,204 @@ def _parse_attendees(ical_component: Any) -> list[EventAttendee]:
     return attendees
 
 
+def _component_to_record(
+    ical_component: Any, fallback_uid: str = ""
+) -> EventRecord | None:
+    """
+    Convert a VEVENT component to an event record.
+
+    Args:
+        ical_component: iCalendar VEVENT component
+        fallback_uid: UID to use when the component has none
+
+    Returns:
+        Event dictionary, or None if the component has no DTSTART
+    """
+    entry = _component_to_entry(ical_component, fallback_uid)
+    return entry[2] if entry is not None else None
+
+
+def _component_to_entry(
+    ical_component: Any, fallback_uid: str = ""
+) -> _EventEntry | None:
+    """
+    Convert a VEVENT component to a (start, end, record, search texts) entry.
+
+    Start and end are naive wall-clock datetimes, so events with and without
+    time zones order the same way their ISO strings would. The end is
+    exclusive: all-day events end at midnight after their last day. The
+    searchable fields are lowercased once here so searches can reuse them.
+    """
+    # icalendar components are CaselessDicts that store upper-cased keys, so
+    # a plain dict lookup skips the key normalisation done on every .get()
+    get: Callable[..., Any] = (
+        partial(dict.get, ical_component)
+        if isinstance(ical_component, dict)
+        else ical_component.get
+    )
+
+    dtstart = get("DTSTART")
+    if not dtstart:
+        return None
+
+    start_dt = dtstart.dt
+    # Most values are datetimes, so test for that first to short-circuit
+    all_day = not isinstance(start_dt, datetime) and isinstance(start_dt, date)
+    if all_day:
+        start_dt = datetime.combine(start_dt, _MIN_TIME)
+
+    dtend = get("DTEND")
+    if dtend:
+        end_dt = dtend.dt
+        if not isinstance(end_dt, datetime) and isinstance(end_dt, date):
+            end_key = datetime.combine(end_dt, _MIN_TIME)
+            # Same string as the last microsecond of the day, without
+            # building that datetime just to format it
+            end_iso = end_dt.isoformat() + _END_OF_DAY_ISO
+        else:
+            end_key = end_dt
+            end_iso = end_dt.isoformat()
+    else:
+        end_key = start_dt + (_ONE_DAY if all_day else _ONE_HOUR)
+        end_iso = (start_dt + _ONE_HOUR).isoformat()
+
+    summary = get("SUMMARY")
+    desc = get("DESCRIPTION")
+    loc = get("LOCATION")
+    uid = get("UID")
+    priority = get("PRIORITY")
+    rrule = get("RRULE")
+    attendees = _parse_attendees(ical_component)
+    title = str(summary) if summary else ""
+    description = str(desc) if desc else ""
+    location = str(loc) if loc else ""
+
+    return (
+        start_dt if start_dt.tzinfo is None else start_dt.replace(tzinfo=None),
+        end_key if end_key.tzinfo is None else end_key.replace(tzinfo=None),
+        {
+            "uid": str(uid) if uid else fallback_uid,
+            "title": title,
+            "start": start_dt.isoformat(),
+            "end": end_iso,
+            "description": description,
+            "location": location,
+            "all_day": all_day,
+            "categories": _parse_categories(get("CATEGORIES")),
+            "priority": int(priority) if priority is not None else None,
+            "recurrence": _recur_text(rrule) if rrule else None,
+            "attendees": attendees,
+        },
+        (
+            title.lower(),
+            description.lower(),
+            location.lower(),
+            "\x00".join([a["email"] for a in attendees]).lower(),
+        ),
+    )
+
+
+def _today_start() -> datetime:
+    """
+    Return local midnight today as a naive datetime.
+
+    Default windows start here, so repeated calls during a day produce the
+    same window bounds and hit the event cache.
+    """
+    return datetime.combine(date.today(), _MIN_TIME)
+
+
+class _Occurrence(NamedTuple):
+    """One occurrence of an expanded recurring calendar object."""
+
+    url: Any
+    icalendar_component: Any
+
+
+# Properties that make an object recur
+_RECURRENCE_PROPS = ("RRULE", "RDATE", "EXDATE")
+
+
+def _expand_recurring(events: list[Any], start: datetime, end: datetime) -> list[Any]:
+    """
+    Expand recurring calendar objects into their occurrences in a window.
+
+    Each occurrence is returned with its actual start and carries its
+    master's RRULE, so event records still describe the recurrence (the
+    expanded components only have a RECURRENCE-ID). Objects that don't recur,
+    or can't be parsed or expanded, are passed through unchanged.
+    """
+    expanded: list[Any] = []
+    for event in events:
+        try:
+            component = event.icalendar_component
+            if not any(prop in component for prop in _RECURRENCE_PROPS):
+                expanded.append(event)
+                continue
+            rrule = component.get("RRULE")
+            event.expand_rrule(start, end)
+        except Exception as e:
+            # _parse_entries logs objects it can't parse
+            logger.debug("Not expanding calendar object %s: %s", event.url, e)
+            expanded.append(event)
+            continue
+        for occurrence in event.icalendar_instance.walk("VEVENT"):
+            if rrule is not None:
+                occurrence["RRULE"] = rrule
+            expanded.append(_Occurrence(event.url, occurrence))
+    return expanded
+
+
+def _parse_entries(events: list[Any]) -> list[_EventEntry]:
+    """
+    Parse calendar objects into event entries sorted by start.
+
+    Objects whose data can't be parsed, or whose properties have unexpected
+    types, are logged and skipped; components without DTSTART are skipped.
+    """
+    entries: list[_EventEntry] = []
+    append = entries.append
+    to_entry = _component_to_entry
+    for event in events:
+        try:
+            # Parses the object's iCalendar data on first access
+            component = event.icalendar_component
+        except Exception as e:
+            logger.debug("Skipping unparsable calendar object %s: %s", event.url, e)
+            continue
+        try:
+            entry = to_entry(component)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug("Skipping malformed event %s: %s", event.url, e)
+            continue
+        if entry is not None:
+            append(entry)
+
+    entries.sort(key=itemgetter(0))
+    return entries
+
+
+def _local_span(entry: _EventEntry) -> tuple[datetime, datetime]:
+    """
+    Return an entry's start and end as naive local times.
+
+    Entry keys are wall-clock times in the event's own zone, but caldav sends
+    naive query bounds as local time. Zoned and UTC times are converted to
+    local time so cached entries compare with bounds as the server would;
+    floating and all-day times are left as they are.
+    """
+    start, end, record = entry[0], entry[1], entry[2]
+    if record["all_day"]:
+        return start, end
+    aware_start = datetime.fromisoformat(record["start"])
+    if aware_start.tzinfo is None:
+        return start, end
+    aware_end = datetime.fromisoformat(record["end"])
+    if aware_end.tzinfo is not None:
+        end = aware_end.astimezone().replace(tzinfo=None)
+    return aware_start.astimezone().replace(tzinfo=None), end
+
+
 class CalDAVClient:
     """
     Client for working with CalDAV calendars.
@@ -295,6 +687,8 @@ class CalDAVClient:
         url: str,
         username: str,
         password: str,
+        cache_dir: str | None = None,
+        calendars_ttl: float | None = None,
     ):
         """
         Initialize CalDAV client.
@@ -303,40 +697,522 @@ class CalDAVClient:
             url: CalDAV server URL (e.g., "https://caldav.example.com/")
             username: Username for authentication
             password: Password or app password for authentication
+            cache_dir: Directory to keep fetched event windows in across
+                restarts (default: memory only)
+            calendars_ttl: Seconds to reuse the calendar list before listing
+                calendars again (default: 300)
         """
         self.url = url
         self.username = username
         self.password = password
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         self.client: Any | None = None
         self.principal: Any | None = None
+        self._calendars_cache: list[Any] | None = None
+        self._calendars_cache_ts = 0.0
+        self.calendars_ttl = _CALENDARS_TTL if calendars_ttl is None else calendars_ttl
+        # Event windows keyed by (calendar URL, start, end)
+        self._events_cache: dict[
+            tuple[str, datetime, datetime], tuple[float, list[_EventEntry]]
+        ] = {}
+        self._events_lock = threading.Lock()
+        self._refreshing: set[tuple[str, datetime, datetime]] = set()
+        # Bumped on every invalidation so fetches that started earlier
+        # don't store results predating a write
+        self._events_generation = 0
+        # Last RFC 6578 sync-token seen per calendar URL
+        self._sync_tokens: dict[str, Any] = {}
+        # Worker threads for get_events_multi, started on its first call and
+        # kept across calls
+        self._pool: ThreadPoolExecutor | None = None
         # Detect Yandex Calendar for special handling
         self.is_yandex = "yandex.ru" in url.lower() or "yandex.com" in url.lower()
 
     def connect(self) -> bool:
         """Connect to CalDAV server."""
+        caldav = _import_caldav()
         try:
             self.client = caldav.DAVClient(
                 url=self.url,
                 username=self.username,
                 password=self.password,
+                timeout=_REQUEST_TIMEOUT,
             )
+            self._configure_pool()
+            self._calendars_cache = None
+            self._invalidate_events()
+            self._prune_disk_cache()
             self.principal = self.client.principal()
             return True
         except Exception as e:
             raise ConnectionError(f"Failed to connect to CalDAV server: {e}") from e
 
+    def _configure_pool(self) -> None:
+        """Tune the DAVClient's HTTP session for repeated WebDAV requests.
+
+        Mounts a sized, retrying adapter. The adapter class is taken from the
+        session itself so this works with whichever requests-compatible
+        backend the caldav library uses.
+        """
+        session = getattr(self.client, "session", None)
+        if session is None:
+            return
+        adapter_cls = type(session.get_adapter(self.url))
+        adapter = adapter_cls(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=_MAX_RETRIES,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        if self.client is not None:
+            self.client.close()
+        self.client = None
+        self.principal = None
+        self._calendars_cache = None
+        self._invalidate_events()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def __enter__(self) -> "CalDAVClient":
+        if not self.principal:
+            self.connect()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _get_calendars(self, ttl: float | None = None) -> list[Any]:
+        """Return the principal's calendars, reusing a recent listing.
+
+        Every public method needs the calendar list, so caching it saves one
+        PROPFIND round-trip per call. The cache is dropped on connection
+        errors and whenever a public method fails, so the next call refetches.
+        ttl defaults to the client's calendars_ttl.
+        """
+        if not self.principal:
+            raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
+
+        if ttl is None:
+            ttl = self.calendars_ttl
+        now = time.monotonic()
+        if self._calendars_cache is None or now - self._calendars_cache_ts >= ttl:
+            try:
+                self._calendars_cache = list(self.principal.calendars())
+            except ConnectionError:
+                self._calendars_cache = None
+                raise
+            self._calendars_cache_ts = now
+        return self._calendars_cache
+
+    def _get_calendar(self, calendar_index: int) -> Any:
+        """Return the calendar at an index of the cached calendar list.
+
+        Raises:
+            ValueError: If there is no calendar at that index
+        """
+        calendars = self._get_calendars()
+        if calendar_index >= len(calendars):
+            raise ValueError(
+                f"Calendar index {calendar_index} not found. "
+                f"Available calendars: {len(calendars)}"
+            )
+        return calendars[calendar_index]
+
+    def _cached_entries(
+        self, calendar: Any, start_date: datetime, end_date: datetime
+    ) -> list[_EventEntry] | None:
+        """
+        Return recently fetched entries covering the requested window.
+
+        An exact window match younger than _EVENTS_TTL is reused as-is; one
+        younger than _EVENTS_STALE_TTL is returned immediately while a
+        background thread refetches it (stale-while-revalidate). A larger
+        fresh window, such as this week when asking for today, is sliced by
+        overlap in local time, provided both windows are naive; recurring
+        events are stored as expanded occurrences, so their starts slice like
+        any other.
+        """
+        url = str(calendar.url)
+        now = time.monotonic()
+        with self._events_lock:
+            hit = self._events_cache.get((url, start_date, end_date))
+            cached = list(self._events_cache.items())
+
+        if hit is not None:
+            age = now - hit[0]
+            if age < _EVENTS_TTL:
+                return hit[1]
+            if age < _EVENTS_STALE_TTL:
+                self._schedule_refresh(calendar, start_date, end_date)
+                return hit[1]
+        elif self.cache_dir is not None:
+            saved = self._load_window(self.cache_dir, calendar, start_date, end_date)
+            if saved is not None:
+                self._schedule_refresh(calendar, start_date, end_date)
+                return saved
+
+        if start_date.tzinfo is not None or end_date.tzinfo is not None:
+            return None
+
+        for (cached_url, start, end), (ts, entries) in cached:
+            if (
+                cached_url != url
+                or now - ts >= _EVENTS_TTL
+                or start.tzinfo is not None
+                or end.tzinfo is not None
+                or not (start <= start_date and end_date <= end)
+            ):
+                continue
+            sliced = []
+            for entry in entries:
+                entry_start, entry_end = _local_span(entry)
+                if entry_start < end_date and entry_end > start_date:
+                    sliced.append(entry)
+            return sliced
+        return None
+
+    def _store_entries(
+        self,
+        calendar: Any,
+        start_date: datetime,
+        end_date: datetime,
+        entries: list[_EventEntry],
+        generation: int,
+    ) -> None:
+        """Cache fetched entries, dropping any that are too old to serve.
+
+        Nothing is stored if the cache was invalidated after ``generation``
+        was read, i.e. while the entries were being fetched.
+        """
+        url = str(calendar.url)
+        now = time.monotonic()
+        with self._events_lock:
+            if generation != self._events_generation:
+                return
+            cache = self._events_cache
+            for key in [
+                k for k, (ts, _) in cache.items() if now - ts >= _EVENTS_STALE_TTL
+            ]:
+                del cache[key]
+            cache[(url, start_date, end_date)] = (now, entries)
+            token = self._sync_tokens.get(url)
+
+        if self.cache_dir is not None:
+            self._save_window(self.cache_dir, url, start_date, end_date, entries, token)
+
+    def _invalidate_events(self) -> None:
+        """Forget all event windows and sync-tokens held in memory.
+
+        Used on connect and close; windows saved on disk are kept, since the
+        server's data hasn't changed.
+        """
+        with self._events_lock:
+            self._events_cache.clear()
+            self._events_generation += 1
+            self._sync_tokens.clear()
+
+    def _calendar_key(self, url: str) -> str:
+        """Prefix of the on-disk file names for one calendar's windows."""
+        key = "\x00".join((self.url, self.username, url))
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    def _window_path(
+        self, cache_dir: Path, url: str, start_date: datetime, end_date: datetime
+    ) -> Path:
+        """Path of the on-disk copy of one event window."""
+        window = f"{start_date.isoformat()}\x00{end_date.isoformat()}"
+        return cache_dir / (
+            f"{self._calendar_key(url)}-"
+            f"{hashlib.sha256(window.encode()).hexdigest()}.json"
+        )
+
+    def _save_window(
+        self,
+        cache_dir: Path,
+        url: str,
+        start_date: datetime,
+        end_date: datetime,
+        entries: list[_EventEntry],
+        token: Any,
+    ) -> None:
+        """Write an event window to the disk cache, ignoring I/O errors.
+
+        The file holds private calendar data, so it is created readable by
+        the owner only.
+        """
+        path = self._window_path(cache_dir, url, start_date, end_date)
+        data = {
+            "sync_token": token if isinstance(token, str) else None,
+            "entries": [
+                [start.isoformat(), end.isoformat(), record, texts]
+                for start, end, record, texts in entries
+            ],
+        }
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data))
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+
+    def _load_window(
+        self,
+        cache_dir: Path,
+        calendar: Any,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[_EventEntry] | None:
+        """
+        Load an event window saved by an earlier process.
+
+        The window goes into the memory cache as stale, so it is served once
+        while being revalidated, and its sync-token is restored so that the
+        check is cheap when nothing changed. A window saved under a different
+        sync-token than the one already held for its calendar is ignored:
+        that token can't vouch for it.
+        """
+        url = str(calendar.url)
+        path = self._window_path(cache_dir, url, start_date, end_date)
+        try:
+            if time.time() - path.stat().st_mtime >= _DISK_CACHE_MAX_AGE:
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entries: list[_EventEntry] = [
+                (
+                    datetime.fromisoformat(start),
+                    datetime.fromisoformat(end),
+                    record,
+                    (texts[0], texts[1], texts[2], texts[3]),
+                )
+                for start, end, record, texts in data["entries"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            return None
+
+        token = data.get("sync_token")
+        with self._events_lock:
+            known = self._sync_tokens.get(url)
+            if known is not None and known != token:
+                return None
+            self._events_cache[(url, start_date, end_date)] = (
+                time.monotonic() - _EVENTS_TTL,
+                entries,
+            )
+            if token:
+                self._sync_tokens[url] = token
+        return entries
+
+    def _prune_disk_cache(self) -> None:
+        """Remove saved event windows too old to be served."""
+        if self.cache_dir is None:
+            return
+        cutoff = time.time() - _DISK_CACHE_MAX_AGE
+        for path in self.cache_dir.glob("*.json"):
+            if not _DISK_CACHE_NAME.fullmatch(path.name):
+                continue
+            with contextlib.suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+
+    def _calendar_changed(self, calendar: Any) -> bool:
+        """
+        Ask the server whether a calendar changed since the last check.
+
+        Sends an RFC 6578 sync-collection REPORT with the stored sync-token;
+        the server answers with only the hrefs changed since then, so an
+        unchanged calendar costs one small request. Returns True when there
+        is no token yet, the server rejects it, or anything changed.
+        """
+        url = str(calendar.url)
+        with self._events_lock:
+            token = self._sync_tokens.get(url)
+        try:
+            changes = calendar.objects_by_sync_token(sync_token=token)
+        except DAVError:
+            with self._events_lock:
+                self._sync_tokens.pop(url, None)
+            return True
+        with self._events_lock:
+            self._sync_tokens[url] = changes.sync_token
+        return token is None or len(changes) > 0
+
+    def _touch_entries(self, calendar: Any, generation: int) -> None:
+        """Mark every cached window of an unchanged calendar as fresh."""
+        url = str(calendar.url)
+        now = time.monotonic()
+        with self._events_lock:
+            if generation != self._events_generation:
+                return
+            cache = self._events_cache
+            for key, (_, entries) in list(cache.items()):
+                if key[0] == url:
+                    cache[key] = (now, entries)
+
+    def _drop_entries(self, calendar: Any) -> None:
+        """Forget every cached window of one calendar, e.g. after a write.
+
+        Other calendars keep their windows. The generation is bumped so a
+        fetch already in flight doesn't store results predating the change.
+        """
+        url = str(calendar.url)
+        with self._events_lock:
+            self._events_generation += 1
+            cache = self._events_cache
+            for key in [key for key in cache if key[0] == url]:
+                del cache[key]
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob(f"{self._calendar_key(url)}-*.json"):
+                if _DISK_CACHE_NAME.fullmatch(path.name):
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+
+    def _schedule_refresh(
+        self, calendar: Any, start_date: datetime, end_date: datetime
+    ) -> None:
+        """Refetch a cached window in a daemon thread, once at a time."""
+        key = (str(calendar.url), start_date, end_date)
+        with self._events_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(
+            target=self._refresh_events,
+            args=(calendar, start_date, end_date),
+            daemon=True,
+        ).start()
+
+    def _refresh_events(
+        self, calendar: Any, start_date: datetime, end_date: datetime
+    ) -> None:
+        """Background body of _schedule_refresh.
+
+        When the calendar's sync-token shows no changes, the cached windows
+        are just marked fresh instead of being downloaded again. Otherwise
+        every cached window of the calendar is dropped before this one is
+        refetched: the token is per calendar, so once it moves past a change
+        it can no longer tell that the other windows predate it.
+        """
+        try:
+            generation = self._events_generation
+            if not self._calendar_changed(calendar):
+                self._touch_entries(calendar, generation)
+                return
+            self._drop_entries(calendar)
+            generation = self._events_generation
+            entries = self._fetch_entries(calendar, start_date, end_date)
+            self._store_entries(calendar, start_date, end_date, entries, generation)
+        except Exception as e:
+            # Keep serving the stale copy; the next miss refetches
+            logger.warning("Background refresh of %s failed: %s", calendar.url, e)
+        finally:
+            with self._events_lock:
+                self._refreshing.discard((str(calendar.url), start_date, end_date))
+
+    def _calendar_entries(
+        self, calendar: Any, start_date: datetime, end_date: datetime
+    ) -> list[_EventEntry]:
+        """Return a calendar's entries for a window, from cache or the server."""
+        entries = self._cached_entries(calendar, start_date, end_date)
+        if entries is None:
+            generation = self._events_generation
+            entries = self._fetch_entries(calendar, start_date, end_date)
+            self._store_entries(calendar, start_date, end_date, entries, generation)
+        return entries
+
+    def _load_missing_data(self, calendar: Any, events: list[Any]) -> list[Any]:
+        """
+        Load calendar data for objects the server returned without it.
+
+        A calendar-query REPORT normally carries each object's data, but some
+        servers only return hrefs, and parsing those objects would then cost
+        one GET each. Fetch them all with a single calendar-multiget instead.
+        """
+        missing = [event for event in events if not event.data]
+        if not missing:
+            return events
+        try:
+            loaded = {
+                str(obj.url): obj
+                for obj in calendar.multiget([event.url for event in missing])
+            }
+        except DAVError:
+            return events
+        return [
+            event if event.data else loaded.get(str(event.url), event)
+            for event in events
+        ]
+
+    def _fetch_entries(
+        self, calendar: Any, start_date: datetime, end_date: datetime
+    ) -> list[_EventEntry]:
+        """Fetch and parse a calendar's events in a window, sorted by start.
+
+        Uses a calendar-query REPORT with a time-range filter, then expands
+        recurring events so each occurrence in the window becomes its own
+        entry with its actual start. Falls back to date_search() on caldav
+        versions whose search() lacks these arguments.
+        """
+        try:
+            events = calendar.search(start=start_date, end=end_date, event=True)
+        except TypeError:
+            events = calendar.date_search(start=start_date, end=end_date)
+
+        events = self._load_missing_data(calendar, events)
+        return _parse_entries(_expand_recurring(events, start_date, end_date))
+
+    def _find_event(self, calendar: Any, uid: str) -> Any | None:
+        """
+        Find an event by UID, letting the server resolve it.
+
+        Falls back to scanning a two-year window around today when the server
+        cannot answer a UID calendar-query (or claims the event is missing,
+        which some servers do for UIDs they failed to index).
+        """
+        try:
+            event = calendar.event_by_uid(uid)
+            if str(event.icalendar_component.get("UID", "")) == uid:
+                return event
+        except DAVError:
+            pass
+
+        now = datetime.now()
+        start_date = now - timedelta(days=365)
+        end_date = now + timedelta(days=365)
+        for event in calendar.date_search(start=start_date, end=end_date):
+            try:
+                if str(event.icalendar_component.get("UID", "")) == uid:
+                    return event
+            except Exception:
+                continue
+        return None
+
     def list_calendars(self) -> list[CalendarInfo]:
         """Get list of available calendars."""
         if not self.principal:
             raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
 
         try:
-            calendars = self.principal.calendars()
+            calendars = self._get_calendars()
             return [
                 CalendarInfo(index=i, name=cal.name, url=str(cal.url))
                 for i, cal in enumerate(calendars)
             ]
         except Exception as e:
+            self._calendars_cache = None
             raise RuntimeError(f"Failed to list calendars: {e}") from e
 
     def create_event(
@@ -389,101 +1265,76 @@ class CalDAVClient:
             raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
 
         try:
-            calendars = self.principal.calendars()
-            if calendar_index >= len(calendars):
-                raise ValueError(
-                    f"Calendar index {calendar_index} not found. "
-                    f"Available calendars: {len(calendars)}"
-                )
+            calendar = self._get_calendar(calendar_index)
 
-            calendar = calendars[calendar_index]
+            # Read the clock once; UID, DTSTAMP and defaults all derive from it
+            now_utc = datetime.now(timezone.utc)
 
             # Set default times
             if start_time is None:
-                start_time = datetime.now() + timedelta(days=1)
+                start_time = now_utc.astimezone().replace(tzinfo=None)
+                start_time += timedelta(days=1)
                 start_time = start_time.replace(
                     hour=14, minute=0, second=0, microsecond=0
                 )
             if end_time is None:
                 end_time = start_time + timedelta(hours=duration_hours)
 
-            # Generate unique UID
-            uid = f"{int(datetime.now().timestamp())}@caldav-mcp"
+            # Generate unique UID; the random part keeps events created within
+            # the same second apart
+            uid = f"{int(now_utc.timestamp())}-{uuid.uuid4().hex}@caldav-mcp"
 
             title_escaped = _escape_ical_text(title)
-            description_escaped = _escape_ical_text(description)
-            location_escaped = _escape_ical_text(location)
+
+            # Format iCalendar data, one content line per list item
+            lines = [
+                *_VCAL_HEADER,
+                f"UID:{uid}",
+                f"DTSTAMP:{_fmt_ical_utc(now_utc)}",
+                f"DTSTART:{_fmt_ical_local(start_time)}",
+                f"DTEND:{_fmt_ical_local(end_time)}",
+                f"SUMMARY:{title_escaped}",
+                f"DESCRIPTION:{_escape_ical_text(description)}",
+                f"LOCATION:{_escape_ical_text(location)}",
+                "STATUS:CONFIRMED",
+                "SEQUENCE:0",
+            ]
+
+            if priority is not None:
+                lines.append(f"PRIORITY:{priority}")
+            if categories:
+                lines.append(_format_categories(categories))
+            if recurrence:
+                lines.append(_format_rrule(recurrence))
+            if attendees:
+                lines.extend(_attendee_lines(attendees))
 
             # Format alarm components for reminders
-            alarm_components = ""
-            if reminders:
-                for reminder in reminders:
-                    minutes_before = reminder.get("minutes_before", 15)
-                    action = reminder.get("action", "DISPLAY").upper()
-                    description_text = _escape_ical_text(
-                        reminder.get("description", title)
-                    )
+            for reminder in reminders or ():
+                action = reminder.get("action", "DISPLAY").upper()
+                if action not in _VALID_ALARM_ACTIONS:
+                    continue
+                trigger = f"TRIGGER:-PT{reminder.get('minutes_before', 15)}M"
+                description_text = _escape_ical_text(reminder.get("description", title))
+
+                lines.extend(("BEGIN:VALARM", f"ACTION:{action}", trigger))
+                if action == "EMAIL":
+                    lines.append(f"SUMMARY:{title_escaped}")
+                    lines.append(f"DESCRIPTION:{description_text}")
+                    email_to = reminder.get("email_to", "")
+                    if email_to:
+                        lines.append(f"ATTENDEE:mailto:{email_to}")
+                else:
+                    lines.append(f"DESCRIPTION:{description_text}")
+                lines.append("END:VALARM")
 
-                    if action == "DISPLAY":
-                        alarm_components += f"""BEGIN:VALARM
-ACTION:DISPLAY
-TRIGGER:-PT{minutes_before}M
-DESCRIPTION:{description_text}
-END:VALARM
-"""
-                    elif action == "EMAIL":
-                        email_to = reminder.get("email_to", "")
-                        alarm_components += f"""BEGIN:VALARM
-ACTION:EMAIL
-TRIGGER:-PT{minutes_before}M
-SUMMARY:{title_escaped}
-DESCRIPTION:{description_text}
-"""
-                        if email_to:
-                            alarm_components += f"ATTENDEE:mailto:{email_to}\n"
-                        alarm_components += "END:VALARM\n"
-                    elif action == "AUDIO":
-                        alarm_components += f"""BEGIN:VALARM
-ACTION:AUDIO
-TRIGGER:-PT{minutes_before}M
-DESCRIPTION:{description_text}
-END:VALARM
-"""
-
-            # Format attendee components
-            attendee_components = _format_attendees(attendees) if attendees else ""
-
-            # Format categories
-            categories_line = _format_categories(categories) if categories else ""
-            if categories_line:
-                categories_line += "\n"
-
-            # Format priority
-            priority_line = f"PRIORITY:{priority}\n" if priority is not None else ""
-
-            # Format recurrence
-            rrule_line = _format_rrule(recurrence) + "\n" if recurrence else ""
-
-            # Format iCalendar data
-            vcal_data = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//CalDAV MCP Server//Python//EN
-CALSCALE:GREGORIAN
-BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")}
-DTSTART:{start_time.strftime("%Y%m%dT%H%M%S")}
-DTEND:{end_time.strftime("%Y%m%dT%H%M%S")}
-SUMMARY:{title_escaped}
-DESCRIPTION:{description_escaped}
-LOCATION:{location_escaped}
-STATUS:CONFIRMED
-SEQUENCE:0
-{priority_line}{categories_line}{rrule_line}{attendee_components}{alarm_components}END:VEVENT
-END:VCALENDAR"""
+            lines.extend(_VCAL_FOOTER)
+            # RFC 5545 content lines are folded at 75 octets and end in CRLF
+            vcal_data = "\r\n".join(map(_fold_ical_line, lines)) + "\r\n"
 
             # Save event
             calendar.save_event(vcal_data)
+            self._drop_entries(calendar)
 
             return {
                 "success": True,
@@ -495,6 +1346,7 @@ END:VCALENDAR"""
             }
 
         except Exception as e:
+            self._calendars_cache = None
             raise RuntimeError(f"Failed to create event: {e}") from e
 
     def get_events(
@@ -516,137 +1368,218 @@ END:VCALENDAR"""
         Returns:
             List of event dictionaries
         """
+        return list(
+            self.iter_events(calendar_index, start_date, end_date, include_all_day)
+        )
+
+    def iter_events(
+        self,
+        calendar_index: int = 0,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        include_all_day: bool = True,
+    ) -> Iterator[EventRecord]:
+        """
+        Iterate over events from calendar for specified period.
+
+        The window is fetched (or taken from the cache) before this returns,
+        so errors are raised here; events are then yielded in start order
+        without building a result list, which suits callers that stop early.
+
+        Args:
+            calendar_index: Calendar index (default: 0)
+            start_date: Start of period (default: today 00:00)
+            end_date: End of period (default: 7 days from start_date)
+            include_all_day: Include all-day events
+
+        Returns:
+            Iterator of event dictionaries
+        """
         if not self.principal:
             raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
 
         try:
-            calendars = self.principal.calendars()
-            if calendar_index >= len(calendars):
-                raise ValueError(
-                    f"Calendar index {calendar_index} not found. "
-                    f"Available calendars: {len(calendars)}"
-                )
-
-            calendar = calendars[calendar_index]
+            calendar = self._get_calendar(calendar_index)
 
             # Set default dates
             if start_date is None:
-                start_date = datetime.now().replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
+                start_date = _today_start()
             if end_date is None:
                 end_date = start_date + timedelta(days=7)
 
-            # Search for events
-            events = calendar.date_search(start=start_date, end=end_date)
+            entries = self._calendar_entries(calendar, start_date, end_date)
+            return (
+                entry[2]
+                for entry in entries
+                if include_all_day or not entry[2]["all_day"]
+            )
 
-            result: list[EventRecord] = []
-            for event in events:
-                try:
-                    ical_component = event.icalendar_component
-
-                    summary = ical_component.get("SUMMARY")
-                    title = str(summary) if summary else ""
-
-                    desc = ical_component.get("DESCRIPTION")
-                    description = str(desc) if desc else ""
-
-                    loc = ical_component.get("LOCATION")
-                    location = str(loc) if loc else ""
-
-                    dtstart = ical_component.get("DTSTART")
-                    dtend = ical_component.get("DTEND")
-
-                    if dtstart:
-                        start_dt = dtstart.dt
-                        if isinstance(start_dt, date) and not isinstance(
-                            start_dt, datetime
-                        ):
-                            start_dt = datetime.combine(start_dt, datetime.min.time())
-                            all_day = True
-                        else:
-                            all_day = False
-                    else:
-                        continue
+        except Exception as e:
+            self._calendars_cache = None
+            raise RuntimeError(f"Failed to get events: {e}") from e
 
-                    if dtend:
-                        end_dt = dtend.dt
-                        if isinstance(end_dt, date) and not isinstance(
-                            end_dt, datetime
-                        ):
-                            end_dt = datetime.combine(end_dt, datetime.max.time())
-                    else:
-                        end_dt = start_dt + timedelta(hours=1)
+    def get_events_multi(
+        self,
+        calendar_indices: list[int],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        include_all_day: bool = True,
+    ) -> list[EventRecord]:
+        """
+        Get events from several calendars for specified period.
 
-                    if not include_all_day and all_day:
-                        continue
+        The calendars are queried concurrently, since each query is a separate
+        HTTP round-trip, and the results are merged in start order.
+
+        Args:
+            calendar_indices: Calendar indexes to query
+            start_date: Start of period (default: today 00:00)
+            end_date: End of period (default: 7 days from start_date)
+            include_all_day: Include all-day events
+
+        Returns:
+            List of event dictionaries
+        """
+        if not self.principal:
+            raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
 
-                    # Extract UID
-                    uid = str(ical_component.get("UID", ""))
-
-                    # Extract categories
-                    cats = ical_component.get("CATEGORIES")
-                    categories = _parse_categories(cats)
-
-                    # Extract priority
-                    priority = ical_component.get("PRIORITY")
-                    priority_value = int(priority) if priority is not None else None
-
-                    # Extract recurrence rule
-                    rrule = ical_component.get("RRULE")
-                    recurrence = str(rrule) if rrule else None
-
-                    # Extract attendees
-                    attendees = _parse_attendees(ical_component)
-
-                    result.append(
-                        {
-                            "uid": uid,
-                            "title": title,
-                            "start": start_dt.isoformat(),
-                            "end": end_dt.isoformat(),
-                            "description": description,
-                            "location": location,
-                            "all_day": all_day,
-                            "categories": categories,
-                            "priority": priority_value,
-                            "recurrence": recurrence,
-                            "attendees": attendees,
-                        }
+        try:
+            calendars = self._get_calendars()
+            for calendar_index in calendar_indices:
+                if calendar_index >= len(calendars):
+                    raise ValueError(
+                        f"Calendar index {calendar_index} not found. "
+                        f"Available calendars: {len(calendars)}"
                     )
 
-                except Exception:
-                    # Skip events that can't be processed
-                    continue
+            # Set default dates
+            if start_date is None:
+                start_date = _today_start()
+            if end_date is None:
+                end_date = start_date + timedelta(days=7)
 
-            # Sort by start time
-            result.sort(key=lambda x: x["start"])
+            selected = [calendars[i] for i in dict.fromkeys(calendar_indices)]
+            with self._events_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=_MAX_FETCH_WORKERS, thread_name_prefix="caldav"
+                    )
+                pool = self._pool
+            futures = [
+                pool.submit(self._calendar_entries, calendar, start_date, end_date)
+                for calendar in selected
+            ]
+            per_calendar = [future.result() for future in futures]
 
-            return result
+            # Each calendar's entries are already sorted by start; merge them
+            return [
+                entry[2]
+                for entry in heapq.merge(*per_calendar, key=itemgetter(0))
+                if include_all_day or not entry[2]["all_day"]
+            ]
 
         except Exception as e:
+            self._calendars_cache = None
             raise RuntimeError(f"Failed to get events: {e}") from e
 
+    def refresh_calendar(self, calendar_index: int = 0) -> bool:
+        """
+        Check a calendar for changes and update its cached event windows.
+
+        Uses the calendar's sync-token, so polling an unchanged calendar
+        transfers almost nothing. Cached windows are kept (and marked fresh)
+        when nothing changed and dropped otherwise.
+
+        Args:
+            calendar_index: Calendar index (default: 0)
+
+        Returns:
+            True if the calendar changed since the last check
+        """
+        if not self.principal:
+            raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
+
+        try:
+            calendar = self._get_calendar(calendar_index)
+
+            generation = self._events_generation
+            changed = self._calendar_changed(calendar)
+            if changed:
+                self._drop_entries(calendar)
+            else:
+                self._touch_entries(calendar, generation)
+            return changed
+
+        except Exception as e:
+            self._calendars_cache = None
+            raise RuntimeError(f"Failed to refresh calendar: {e}") from e
+
+    def get_busy_intervals(
+        self,
+        calendar_index: int = 0,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Get busy time intervals from the server's free/busy report.
+
+        The server computes the intervals and returns a compact VFREEBUSY,
+        so availability checks don't need to download and parse every event.
+
+        Args:
+            calendar_index: Calendar index (default: 0)
+            start_date: Start of period (default: today 00:00)
+            end_date: End of period (default: 7 days from start_date)
+
+        Returns:
+            Sorted list of (start, end) tuples
+        """
+        if not self.principal:
+            raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
+
+        try:
+            calendar = self._get_calendar(calendar_index)
+
+            # Set default dates
+            if start_date is None:
+                start_date = _today_start()
+            if end_date is None:
+                end_date = start_date + timedelta(days=7)
+
+            freebusy = calendar.freebusy_request(start=start_date, end=end_date)
+
+            intervals: list[tuple[datetime, datetime]] = []
+            for component in freebusy.icalendar_instance.walk("VFREEBUSY"):
+                periods = component.get("FREEBUSY", [])
+                if not isinstance(periods, list):
+                    periods = [periods]
+                for period in periods:
+                    if period.params.get("FBTYPE", "BUSY").upper() == "FREE":
+                        continue
+                    start, end = period.dt
+                    if isinstance(end, timedelta):
+                        end = start + end
+                    intervals.append((start, end))
+
+            intervals.sort()
+            return intervals
+
+        except Exception as e:
+            self._calendars_cache = None
+            raise RuntimeError(f"Failed to get busy intervals: {e}") from e
+
     def get_today_events(self, calendar_index: int = 0) -> list[EventRecord]:
         """Get all events for today."""
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
-        return self.get_events(calendar_index, today_start, today_end)
+        today_start = _today_start()
+        return self.get_events(calendar_index, today_start, today_start + _ONE_DAY)
 
     def get_week_events(
         self, calendar_index: int = 0, start_from_today: bool = True
     ) -> list[EventRecord]:
         """Get all events for the week."""
-        if start_from_today:
-            start_date = datetime.now().replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-        else:
-            today = datetime.now()
-            days_since_monday = today.weekday()
-            start_date = (today - timedelta(days=days_since_monday)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
+        start_date = _today_start()
+        if not start_from_today:
+            start_date -= timedelta(days=start_date.weekday())
 
         end_date = start_date + timedelta(days=7)
         return self.get_events(calendar_index, start_date, end_date)
@@ -666,93 +1599,19 @@ END:VCALENDAR"""
             raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
 
         try:
-            calendars = self.principal.calendars()
-            if calendar_index >= len(calendars):
-                raise ValueError(
-                    f"Calendar index {calendar_index} not found. "
-                    f"Available calendars: {len(calendars)}"
-                )
-
-            calendar = calendars[calendar_index]
+            calendar = self._get_calendar(calendar_index)
 
-            # Search for event by UID
-            # Try to search in a wide date range (last year to next year)
-            start_date = datetime.now() - timedelta(days=365)
-            end_date = datetime.now() + timedelta(days=365)
-            events = calendar.date_search(start=start_date, end=end_date)
+            event = self._find_event(calendar, uid)
+            if event is None:
+                return None
 
-            for event in events:
-                try:
-                    ical_component = event.icalendar_component
-                    event_uid = str(ical_component.get("UID", ""))
-                    if event_uid == uid:
-                        # Parse event similar to get_events
-                        summary = ical_component.get("SUMMARY")
-                        title = str(summary) if summary else ""
-
-                        desc = ical_component.get("DESCRIPTION")
-                        description = str(desc) if desc else ""
-
-                        loc = ical_component.get("LOCATION")
-                        location = str(loc) if loc else ""
-
-                        dtstart = ical_component.get("DTSTART")
-                        dtend = ical_component.get("DTEND")
-
-                        if dtstart:
-                            start_dt = dtstart.dt
-                            if isinstance(start_dt, date) and not isinstance(
-                                start_dt, datetime
-                            ):
-                                start_dt = datetime.combine(
-                                    start_dt, datetime.min.time()
-                                )
-                                all_day = True
-                            else:
-                                all_day = False
-                        else:
-                            continue
-
-                        if dtend:
-                            end_dt = dtend.dt
-                            if isinstance(end_dt, date) and not isinstance(
-                                end_dt, datetime
-                            ):
-                                end_dt = datetime.combine(end_dt, datetime.max.time())
-                        else:
-                            end_dt = start_dt + timedelta(hours=1)
-
-                        # Extract additional fields
-                        cats = ical_component.get("CATEGORIES")
-                        categories = _parse_categories(cats)
-
-                        priority = ical_component.get("PRIORITY")
-                        priority_value = int(priority) if priority is not None else None
-
-                        rrule = ical_component.get("RRULE")
-                        recurrence = str(rrule) if rrule else None
-
-                        attendees = _parse_attendees(ical_component)
-
-                        return {
-                            "uid": uid,
-                            "title": title,
-                            "start": start_dt.isoformat(),
-                            "end": end_dt.isoformat(),
-                            "description": description,
-                            "location": location,
-                            "all_day": all_day,
-                            "categories": categories,
-                            "priority": priority_value,
-                            "recurrence": recurrence,
-                            "attendees": attendees,
-                        }
-                except Exception:
-                    continue
-
-            return None
+            try:
+                return _component_to_record(event.icalendar_component, uid)
+            except Exception:
+                return None
 
         except Exception as e:
+            self._calendars_cache = None
             raise RuntimeError(f"Failed to get event by UID: {e}") from e
 
     def delete_event(self, uid: str, calendar_index: int = 0) -> EventDeletionResult:
@@ -770,39 +1629,90 @@ END:VCALENDAR"""
             raise RuntimeError("Not connected to CalDAV server. Call connect() first.")
 
         try:
-            calendars = self.principal.calendars()
-            if calendar_index >= len(calendars):
-                raise ValueError(
-                    f"Calendar index {calendar_index} not found. "
-                    f"Available calendars: {len(calendars)}"
-                )
-
-            calendar = calendars[calendar_index]
-
-            # Find the event
-            start_date = datetime.now() - timedelta(days=365)
-            end_date = datetime.now() + timedelta(days=365)
-            events = calendar.date_search(start=start_date, end=end_date)
-
-            for event in events:
-                try:
-                    ical_component = event.icalendar_component
-                    event_uid = str(ical_component.get("UID", ""))
-                    if event_uid == uid:
-                        event.delete()
-                        return {
-                            "success": True,
-                            "uid": uid,
-                            "message": "Event deleted successfully",
-                        }
-                except Exception:
-                    continue
+            calendar = self._get_calendar(calendar_index)
+
+            event = self._find_event(calendar, uid)
+            if event is not None:
+                event.delete()
+                self._drop_entries(calendar)
+                return {
+                    "success": True,
+                    "uid": uid,
+                    "message": "Event deleted successfully",
+                }
 
             raise ValueError(f"Event with UID {uid} not found")
 
         except Exception as e:
+            self._calendars_cache = None
             raise RuntimeError(f"Failed to delete event: {e}") from e
 
+    def _text_match_events(
+        self,
+        calendar_index: int,
+        query: str,
+        fields: frozenset[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[_EventEntry] | None:
+        """
+        Fetch entries for events whose searched properties contain the query.
+
+        Uses case-insensitive CalDAV text-match filters so only candidate
+        events are transferred, with one REPORT per field since filters on
+        several properties are combined with AND. Returns None when the
+        events are already cached locally or the server rejects the query, in
+        which case the caller filters the full date range instead. Callers
+        only pass ASCII queries, which the collation can fold.
+        """
+        calendars = self._get_calendars()
+        if calendar_index >= len(calendars):
+            return None
+        calendar = calendars[calendar_index]
+        if self._cached_entries(calendar, start_date, end_date) is not None:
+            return None
+
+        from caldav.elements import cdav
+
+        query_lower = query.lower()
+        seen: set[tuple[str, datetime]] = set()
+        entries: list[_EventEntry] = []
+        try:
+            for field in fields:
+                prop = _TEXT_MATCH_PROPS[field]
+                match = cdav.TextMatch(query, collation=_TEXT_MATCH_COLLATION)
+                events = calendar.search(
+                    start=start_date,
+                    end=end_date,
+                    event=True,
+                    filters=[cdav.PropFilter(prop) + match],
+                )
+                for event in _expand_recurring(events, start_date, end_date):
+                    try:
+                        component = event.icalendar_component
+                    except Exception:
+                        continue
+                    # Servers match loosely; check the one property
+                    # before paying for a full conversion
+                    if query_lower not in str(component.get(prop, "")).lower():
+                        continue
+                    try:
+                        entry = _component_to_entry(component)
+                    except (AttributeError, TypeError, ValueError):
+                        continue
+                    if entry is None:
+                        continue
+                    # Expanded occurrences share their resource URL
+                    key = (str(event.url), entry[0])
+                    if key not in seen:
+                        seen.add(key)
+                        entries.append(entry)
+        except DAVError:
+            return None
+
+        entries.sort(key=itemgetter(0))
+        return entries
+
     def search_events(
         self,
         calendar_index: int = 0,
@@ -834,52 +1744,47 @@ END:VCALENDAR"""
             )
 
         try:
-            # Get events in date range
+            if not query:
+                return self.get_events(
+                    calendar_index=calendar_index,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
 
-            all_events = self.get_events(
-                calendar_index=calendar_index,
-                start_date=start_date,
-                end_date=end_date,
+            fields = (
+                _SEARCH_FIELDS if search_fields is None else frozenset(search_fields)
             )
 
-            if not query:
-                return all_events
+            # Let the server narrow the candidates when it can; results are
+            # still checked below since servers differ in how they match.
+            entries = None
+            if query.isascii() and fields <= _TEXT_MATCH_PROPS.keys():
+                entries = self._text_match_events(
+                    calendar_index, query, fields, start_date, end_date
+                )
+            if entries is None:
+                # Get events in date range
+                entries = self._calendar_entries(
+                    self._get_calendar(calendar_index), start_date, end_date
+                )
 
             query_lower = query.lower()
-            if search_fields is None:
-                search_fields = ["title", "description", "location", "attendees"]
+            # Single-term substring tests on the pre-lowercased texts are one
+            # C-level scan each, so no per-search lowering or joining is
+            # needed; a re.IGNORECASE pattern would be about 3x slower here
+            indices = [
+                i for i, name in enumerate(_SEARCH_TEXT_FIELDS) if name in fields
+            ]
 
             results: list[EventRecord] = []
-            for event in all_events:
-                match = False
-
-                if (
-                    (
-                        "title" in search_fields
-                        and query_lower in event.get("title", "").lower()
-                    )
-                    or (
-                        "description" in search_fields
-                        and query_lower in event.get("description", "").lower()
-                    )
-                    or (
-                        "location" in search_fields
-                        and query_lower in event.get("location", "").lower()
-                    )
-                ):
-                    match = True
-                elif "attendees" in search_fields:
-                    attendees = event.get("attendees") or []
-                    for attendee in attendees:
-                        email = attendee.get("email", "").lower()
-                        if query_lower in email:
-                            match = True
-                            break
-
-                if match:
-                    results.append(event)
+            for _, _, event, texts in entries:
+                for i in indices:
+                    if query_lower in texts[i]:
+                        results.append(event)
+                        break
 
             return results
 
         except Exception as e:
+            self._calendars_cache = None
             raise RuntimeError(f"Failed to search events: {e}") from e
@@ -1,39 +1,128 @@
 """MCP server for CalDAV calendar integration."""
 
+import asyncio
+import functools
 import json
 import logging
+import math
 import os
-from collections.abc import AsyncIterator, Sequence
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from mcp.server import Server
-from mcp.types import TextContent, Tool
+from mcp.types import CallToolResult, TextContent, Tool
 
+from . import _env_flag
 from .client import CalDAVClient
 
 # Configure logging
 logger = logging.getLogger("mcp-caldav")
 
+# Tool results are read by programs, so they are compact unless asked for
+_PRETTY = _env_flag("CALDAV_MCP_PRETTY")
 
-@dataclass
+try:
+    import orjson
+
+    _ORJSON_OPTION = orjson.OPT_INDENT_2 if _PRETTY else 0
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result to JSON text."""
+        text: str = orjson.dumps(obj, option=_ORJSON_OPTION).decode()
+        return text
+
+except ImportError:
+    _JSON_KWARGS: dict[str, Any] = (
+        {"indent": 2} if _PRETTY else {"separators": (",", ":")}
+    )
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result to JSON text."""
+        return json.dumps(obj, ensure_ascii=False, **_JSON_KWARGS)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 tool argument, accepting a trailing Z for UTC.
+
+    datetime.fromisoformat is implemented in C and beats any pure-Python
+    field slicing; it only needs the Z spelled as an offset before 3.11.
+    Results are memoized, since clients tend to resend the same window
+    bounds, and datetimes are immutable so sharing them is safe.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class AppContext:
     """Application context for MCP CalDAV."""
 
     client: CalDAVClient | None = None
 
 
-def get_caldav_config() -> dict[str, str | None]:
-    """Get CalDAV configuration from environment variables."""
-    return {
-        "url": os.getenv("CALDAV_URL"),  # No default - must be configured
-        "username": os.getenv("CALDAV_USERNAME")
-        or os.getenv("YANDEX_USERNAME"),  # Backward compatibility
-        "password": os.getenv("CALDAV_PASSWORD")
-        or os.getenv("YANDEX_PASSWORD"),  # Backward compatibility
-    }
+def _calendar_cache_ttl() -> float | None:
+    """Read CALDAV_CALENDAR_CACHE_TTL, or None to use the client's default.
+
+    Values that aren't a non-negative number of seconds are logged and
+    ignored rather than stopping the server.
+    """
+    value = os.getenv("CALDAV_CALENDAR_CACHE_TTL")
+    if not value:
+        return None
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = math.nan
+    if not (math.isfinite(ttl) and ttl >= 0):
+        logger.warning(
+            "Ignoring CALDAV_CALENDAR_CACHE_TTL=%r: expected a non-negative "
+            "number of seconds",
+            value,
+        )
+        return None
+    return ttl
+
+
+@functools.cache
+def get_caldav_config() -> Mapping[str, Any]:
+    """Get CalDAV configuration from environment variables.
+
+    The environment is settled before the server starts, so it is read
+    once per process; the result is read-only because it is shared.
+    """
+    return MappingProxyType(
+        {
+            "url": os.getenv("CALDAV_URL"),  # No default - must be configured
+            "username": os.getenv("CALDAV_USERNAME")
+            or os.getenv("YANDEX_USERNAME"),  # Backward compatibility
+            "password": os.getenv("CALDAV_PASSWORD")
+            or os.getenv("YANDEX_PASSWORD"),  # Backward compatibility
+            "cache_dir": os.getenv("CALDAV_CACHE_DIR"),  # Optional on-disk event cache
+            # Optional seconds to reuse the calendar list
+            "calendar_cache_ttl": _calendar_cache_ttl(),
+        }
+    )
+
+
+# Required settings as (environment variable, configuration key)
+_REQUIRED = (
+    ("CALDAV_URL", "url"),
+    ("CALDAV_USERNAME", "username"),
+    ("CALDAV_PASSWORD", "password"),
+)
+
+
+def _missing_vars(config: Mapping[str, Any]) -> list[str]:
+    """Return the environment variables for required settings left unset."""
+    return [env for env, key in _REQUIRED if not config.get(key)]
 
 
 @asynccontextmanager
@@ -41,577 +130,552 @@ async def server_lifespan(server: Server) -> AsyncIterator[AppContext]:  # noqa:
     """Initialize and clean up application resources."""
     config = get_caldav_config()
 
+    client = None
     try:
-        client = None
         if config["url"] and config["username"] and config["password"]:
             client = CalDAVClient(
                 url=config["url"],
                 username=config["username"],
                 password=config["password"],
+                cache_dir=config.get("cache_dir"),
+                calendars_ttl=config.get("calendar_cache_ttl"),
             )
             client.connect()
             logger.info(
-                f"Connected to CalDAV server: {config['url']} "
-                f"for user: {config['username']}"
+                "Connected to CalDAV server: %s for user: %s",
+                config["url"],
+                config["username"],
             )
         else:
-            missing = []
-            if not config["url"]:
-                missing.append("CALDAV_URL")
-            if not config["username"]:
-                missing.append("CALDAV_USERNAME")
-            if not config["password"]:
-                missing.append("CALDAV_PASSWORD")
             logger.warning(
-                f"CalDAV not configured. Missing: {', '.join(missing)}. "
-                "Set these environment variables to enable calendar functionality."
+                "CalDAV not configured. Missing: %s. "
+                "Set these environment variables to enable calendar functionality.",
+                ", ".join(_missing_vars(config)),
             )
 
         yield AppContext(client=client)
     finally:
-        # Cleanup if needed
-        pass
+        # Release the CalDAV HTTP connection pool
+        if client is not None:
+            client.close()
 
 
 # Create server instance
 app = Server("mcp-caldav", lifespan=server_lifespan)
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available CalDAV tools."""
-    ctx = app.request_context.lifespan_context
-
-    if not ctx or not ctx.client:
-        return []
-
-    tools = [
-        Tool(
-            name="caldav_list_calendars",
-            description="List all available calendars",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="caldav_create_event",
-            description="Create a new event in the calendar",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_index": {
-                        "type": "integer",
-                        "description": "Index of the calendar (default: 0)",
-                        "default": 0,
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Event title",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Event description",
-                        "default": "",
-                    },
-                    "location": {
-                        "type": "string",
-                        "description": "Event location",
-                        "default": "",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time in ISO format (e.g., '2025-01-20T14:00:00'). "
-                        "If not provided, defaults to tomorrow at 14:00",
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End time in ISO format (e.g., '2025-01-20T15:00:00'). "
-                        "If not provided, uses duration_hours from start_time",
-                    },
-                    "duration_hours": {
-                        "type": "number",
-                        "description": "Duration in hours (used if end_time not provided)",
-                        "default": 1.0,
-                    },
-                    "reminders": {
-                        "type": "array",
-                        "description": "List of reminders. Each reminder is an object with: "
-                        "minutes_before (integer), action ('DISPLAY', 'EMAIL', or 'AUDIO'), "
-                        "and optional description (string)",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "minutes_before": {"type": "integer"},
-                                "action": {
-                                    "type": "string",
-                                    "enum": ["DISPLAY", "EMAIL", "AUDIO"],
-                                },
-                                "description": {"type": "string"},
+# Tool schemas are static, so they are built once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="caldav_list_calendars",
+        description="List all available calendars",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="caldav_create_event",
+        description="Create a new event in the calendar",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_index": {
+                    "type": "integer",
+                    "description": "Index of the calendar (default: 0)",
+                    "default": 0,
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Event title",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Event description",
+                    "default": "",
+                },
+                "location": {
+                    "type": "string",
+                    "description": "Event location",
+                    "default": "",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "Start time in ISO format (e.g., '2025-01-20T14:00:00'). "
+                    "If not provided, defaults to tomorrow at 14:00",
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "End time in ISO format (e.g., '2025-01-20T15:00:00'). "
+                    "If not provided, uses duration_hours from start_time",
+                },
+                "duration_hours": {
+                    "type": "number",
+                    "description": "Duration in hours (used if end_time not provided)",
+                    "default": 1.0,
+                },
+                "reminders": {
+                    "type": "array",
+                    "description": "List of reminders. Each reminder is an object with: "
+                    "minutes_before (integer), action ('DISPLAY', 'EMAIL', or 'AUDIO'), "
+                    "and optional description (string)",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "minutes_before": {"type": "integer"},
+                            "action": {
+                                "type": "string",
+                                "enum": ["DISPLAY", "EMAIL", "AUDIO"],
                             },
-                            "required": ["minutes_before", "action"],
+                            "description": {"type": "string"},
                         },
+                        "required": ["minutes_before", "action"],
                     },
-                    "attendees": {
-                        "type": "array",
-                        "description": "List of attendee email addresses (strings) or objects with 'email' and 'status' (ACCEPTED/DECLINED/TENTATIVE/NEEDS-ACTION)",
-                        "items": {
-                            "oneOf": [
-                                {"type": "string"},
-                                {
-                                    "type": "object",
-                                    "properties": {
-                                        "email": {"type": "string"},
-                                        "status": {
-                                            "type": "string",
-                                            "enum": [
-                                                "ACCEPTED",
-                                                "DECLINED",
-                                                "TENTATIVE",
-                                                "NEEDS-ACTION",
-                                            ],
-                                        },
+                },
+                "attendees": {
+                    "type": "array",
+                    "description": "List of attendee email addresses (strings) or objects with 'email' and 'status' (ACCEPTED/DECLINED/TENTATIVE/NEEDS-ACTION)",
+                    "items": {
+                        "oneOf": [
+                            {"type": "string"},
+                            {
+                                "type": "object",
+                                "properties": {
+                                    "email": {"type": "string"},
+                                    "status": {
+                                        "type": "string",
+                                        "enum": [
+                                            "ACCEPTED",
+                                            "DECLINED",
+                                            "TENTATIVE",
+                                            "NEEDS-ACTION",
+                                        ],
                                     },
-                                    "required": ["email"],
                                 },
-                            ]
-                        },
-                    },
-                    "categories": {
-                        "type": "array",
-                        "description": "List of category/tag strings",
-                        "items": {"type": "string"},
-                    },
-                    "priority": {
-                        "type": "integer",
-                        "description": "Priority 0-9 (0 = highest, 9 = lowest)",
-                        "minimum": 0,
-                        "maximum": 9,
-                    },
-                    "recurrence": {
-                        "type": "object",
-                        "description": "Recurrence rule for repeating events",
-                        "properties": {
-                            "frequency": {
-                                "type": "string",
-                                "enum": ["DAILY", "WEEKLY", "MONTHLY", "YEARLY"],
-                                "description": "How often the event repeats",
-                            },
-                            "interval": {
-                                "type": "integer",
-                                "description": "Interval between occurrences (default: 1)",
-                                "default": 1,
-                            },
-                            "count": {
-                                "type": "integer",
-                                "description": "Number of occurrences",
-                            },
-                            "until": {
-                                "type": "string",
-                                "description": "End date in ISO format",
-                            },
-                            "byday": {
-                                "type": "string",
-                                "description": "Days of week (e.g., 'MO,WE,FR' for Monday, Wednesday, Friday)",
-                            },
-                            "bymonthday": {
-                                "type": "integer",
-                                "description": "Day of month (1-31)",
-                            },
-                            "bymonth": {
-                                "type": "integer",
-                                "description": "Month (1-12)",
+                                "required": ["email"],
                             },
+                        ]
+                    },
+                },
+                "categories": {
+                    "type": "array",
+                    "description": "List of category/tag strings",
+                    "items": {"type": "string"},
+                },
+                "priority": {
+                    "type": "integer",
+                    "description": "Priority 0-9 (0 = highest, 9 = lowest)",
+                    "minimum": 0,
+                    "maximum": 9,
+                },
+                "recurrence": {
+                    "type": "object",
+                    "description": "Recurrence rule for repeating events",
+                    "properties": {
+                        "frequency": {
+                            "type": "string",
+                            "enum": ["DAILY", "WEEKLY", "MONTHLY", "YEARLY"],
+                            "description": "How often the event repeats",
+                        },
+                        "interval": {
+                            "type": "integer",
+                            "description": "Interval between occurrences (default: 1)",
+                            "default": 1,
+                        },
+                        "count": {
+                            "type": "integer",
+                            "description": "Number of occurrences",
+                        },
+                        "until": {
+                            "type": "string",
+                            "description": "End date in ISO format",
+                        },
+                        "byday": {
+                            "type": "string",
+                            "description": "Days of week (e.g., 'MO,WE,FR' for Monday, Wednesday, Friday)",
+                        },
+                        "bymonthday": {
+                            "type": "integer",
+                            "description": "Day of month (1-31)",
+                        },
+                        "bymonth": {
+                            "type": "integer",
+                            "description": "Month (1-12)",
                         },
-                        "required": ["frequency"],
                     },
+                    "required": ["frequency"],
                 },
-                "required": ["title"],
             },
-        ),
-        Tool(
-            name="caldav_get_event_by_uid",
-            description="Get a specific event by its UID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "uid": {
-                        "type": "string",
-                        "description": "Event UID",
-                    },
-                    "calendar_index": {
-                        "type": "integer",
-                        "description": "Index of the calendar (default: 0)",
-                        "default": 0,
-                    },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="caldav_get_event_by_uid",
+        description="Get a specific event by its UID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "uid": {
+                    "type": "string",
+                    "description": "Event UID",
+                },
+                "calendar_index": {
+                    "type": "integer",
+                    "description": "Index of the calendar (default: 0)",
+                    "default": 0,
                 },
-                "required": ["uid"],
             },
-        ),
-        Tool(
-            name="caldav_delete_event",
-            description="Delete an event by its UID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "uid": {
-                        "type": "string",
-                        "description": "Event UID to delete",
-                    },
-                    "calendar_index": {
-                        "type": "integer",
-                        "description": "Index of the calendar (default: 0)",
-                        "default": 0,
-                    },
+            "required": ["uid"],
+        },
+    ),
+    Tool(
+        name="caldav_delete_event",
+        description="Delete an event by its UID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "uid": {
+                    "type": "string",
+                    "description": "Event UID to delete",
+                },
+                "calendar_index": {
+                    "type": "integer",
+                    "description": "Index of the calendar (default: 0)",
+                    "default": 0,
                 },
-                "required": ["uid"],
             },
-        ),
-        Tool(
-            name="caldav_search_events",
-            description="Search events by text, attendees, or location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_index": {
-                        "type": "integer",
-                        "description": "Index of the calendar (default: 0)",
-                        "default": 0,
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "Search query string",
-                    },
-                    "search_fields": {
-                        "type": "array",
-                        "description": "Fields to search in: 'title', 'description', 'location', 'attendees'. If not provided, searches in all fields",
-                        "items": {
-                            "type": "string",
-                            "enum": ["title", "description", "location", "attendees"],
-                        },
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date for search period in ISO format",
-                    },
-                    "end_date": {
+            "required": ["uid"],
+        },
+    ),
+    Tool(
+        name="caldav_search_events",
+        description="Search events by text, attendees, or location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_index": {
+                    "type": "integer",
+                    "description": "Index of the calendar (default: 0)",
+                    "default": 0,
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Search query string",
+                },
+                "search_fields": {
+                    "type": "array",
+                    "description": "Fields to search in: 'title', 'description', 'location', 'attendees'. If not provided, searches in all fields",
+                    "items": {
                         "type": "string",
-                        "description": "End date for search period in ISO format",
+                        "enum": ["title", "description", "location", "attendees"],
                     },
                 },
-                "required": ["start_date", "end_date"],
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date for search period in ISO format",
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date for search period in ISO format",
+                },
             },
-        ),
-        Tool(
-            name="caldav_get_events",
-            description="Get events from calendar for a specified period",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_index": {
-                        "type": "integer",
-                        "description": "Index of the calendar (default: 0)",
-                        "default": 0,
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date in ISO format (e.g., '2025-01-20T00:00:00'). "
-                        "Defaults to today 00:00",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date in ISO format (e.g., '2025-01-27T23:59:59'). "
-                        "Defaults to 7 days from start_date",
-                    },
-                    "include_all_day": {
-                        "type": "boolean",
-                        "description": "Include all-day events",
-                        "default": True,
-                    },
+            "required": ["start_date", "end_date"],
+        },
+    ),
+    Tool(
+        name="caldav_get_events",
+        description="Get events from calendar for a specified period",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_index": {
+                    "type": "integer",
+                    "description": "Index of the calendar (default: 0)",
+                    "default": 0,
+                },
+                "calendar_indices": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "minItems": 1,
+                    "description": "Indexes of several calendars to query "
+                    "together, merged by start time (overrides calendar_index)",
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date in ISO format (e.g., '2025-01-20T00:00:00'). "
+                    "Defaults to today 00:00",
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date in ISO format (e.g., '2025-01-27T23:59:59'). "
+                    "Defaults to 7 days from start_date",
+                },
+                "include_all_day": {
+                    "type": "boolean",
+                    "description": "Include all-day events",
+                    "default": True,
                 },
             },
-        ),
-        Tool(
-            name="caldav_get_today_events",
-            description="Get all events for today",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_index": {
-                        "type": "integer",
-                        "description": "Index of the calendar (default: 0)",
-                        "default": 0,
-                    },
+        },
+    ),
+    Tool(
+        name="caldav_get_today_events",
+        description="Get all events for today",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_index": {
+                    "type": "integer",
+                    "description": "Index of the calendar (default: 0)",
+                    "default": 0,
                 },
             },
-        ),
-        Tool(
-            name="caldav_get_week_events",
-            description="Get all events for the week",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_index": {
-                        "type": "integer",
-                        "description": "Index of the calendar (default: 0)",
-                        "default": 0,
-                    },
-                    "start_from_today": {
-                        "type": "boolean",
-                        "description": "Start from today (True) or from Monday (False)",
-                        "default": True,
-                    },
+        },
+    ),
+    Tool(
+        name="caldav_get_week_events",
+        description="Get all events for the week",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_index": {
+                    "type": "integer",
+                    "description": "Index of the calendar (default: 0)",
+                    "default": 0,
+                },
+                "start_from_today": {
+                    "type": "boolean",
+                    "description": "Start from today (True) or from Monday (False)",
+                    "default": True,
                 },
             },
-        ),
-    ]
+        },
+    ),
+]
 
-    return tools
 
+# Argument validators compiled once per tool, instead of the per-call
+# jsonschema.validate() the framework would do (which re-checks the schema)
+_VALIDATORS = {
+    tool.name: validator_for(tool.inputSchema)(tool.inputSchema) for tool in _TOOLS
+}
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
-    """Handle tool calls for CalDAV operations."""
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available CalDAV tools."""
     ctx = app.request_context.lifespan_context
 
     if not ctx or not ctx.client:
-        config = get_caldav_config()
-        missing = []
-        if not config.get("url"):
-            missing.append("CALDAV_URL")
-        if not config.get("username"):
-            missing.append("CALDAV_USERNAME")
-        if not config.get("password"):
-            missing.append("CALDAV_PASSWORD")
-
-        message = "CalDAV client not configured."
-        if missing:
-            message += f" Missing variables: {', '.join(missing)}."
-        else:
-            message += (
-                " Please configure CALDAV_URL, CALDAV_USERNAME, and CALDAV_PASSWORD."
-            )
-
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps({"error": message}, indent=2, ensure_ascii=False),
-            )
-        ]
-
-    try:
-        if name == "caldav_list_calendars":
-            calendars = ctx.client.list_calendars()
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(calendars, indent=2, ensure_ascii=False),
-                )
-            ]
-
-        elif name == "caldav_create_event":
-            calendar_index = arguments.get("calendar_index", 0)
-            title = arguments.get("title")
-            description = arguments.get("description", "")
-            location = arguments.get("location", "")
-            start_time_str = arguments.get("start_time")
-            end_time_str = arguments.get("end_time")
-            duration_hours = arguments.get("duration_hours", 1.0)
-            reminders = arguments.get("reminders")
-            attendees = arguments.get("attendees")
-            categories = arguments.get("categories")
-            priority = arguments.get("priority")
-            recurrence = arguments.get("recurrence")
-
-            start_time = None
-            if start_time_str:
-                start_time = datetime.fromisoformat(
-                    start_time_str.replace("Z", "+00:00")
-                )
-
-            end_time = None
-            if end_time_str:
-                end_time = datetime.fromisoformat(end_time_str.replace("Z", "+00:00"))
-
-            # Parse recurrence until date if provided
-            if recurrence and recurrence.get("until"):
-                until_str = recurrence["until"]
-                try:
-                    recurrence["until"] = datetime.fromisoformat(
-                        until_str.replace("Z", "+00:00")
-                    )
-                except ValueError:
-                    # Try date format
-                    from contextlib import suppress
-
-                    with suppress(ValueError):
-                        recurrence["until"] = datetime.fromisoformat(until_str).date()
-
-            result = ctx.client.create_event(
-                calendar_index=calendar_index,
-                title=title,
-                description=description,
-                location=location,
-                start_time=start_time,
-                end_time=end_time,
-                duration_hours=duration_hours,
-                reminders=reminders,
-                attendees=attendees,
-                categories=categories,
-                priority=priority,
-                recurrence=recurrence,
-            )
-
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2, ensure_ascii=False),
-                )
-            ]
-
-        elif name == "caldav_get_events":
-            calendar_index = arguments.get("calendar_index", 0)
-            start_date_str = arguments.get("start_date")
-            end_date_str = arguments.get("end_date")
-            include_all_day = arguments.get("include_all_day", True)
-
-            start_date = None
-            if start_date_str:
-                start_date = datetime.fromisoformat(
-                    start_date_str.replace("Z", "+00:00")
-                )
-            end_date = None
-            if end_date_str:
-                end_date = datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
-
-            events = ctx.client.get_events(
-                calendar_index=calendar_index,
-                start_date=start_date,
-                end_date=end_date,
-                include_all_day=include_all_day,
-            )
-
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(events, indent=2, ensure_ascii=False),
-                )
-            ]
-
-        elif name == "caldav_get_today_events":
-            calendar_index = arguments.get("calendar_index", 0)
-            events = ctx.client.get_today_events(calendar_index=calendar_index)
-
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(events, indent=2, ensure_ascii=False),
-                )
-            ]
+        return []
 
-        elif name == "caldav_get_week_events":
-            calendar_index = arguments.get("calendar_index", 0)
-            start_from_today = arguments.get("start_from_today", True)
-            events = ctx.client.get_week_events(
-                calendar_index=calendar_index, start_from_today=start_from_today
-            )
+    return list(_TOOLS)
+
+
+# Values for caldav_create_event arguments the caller left out
+_CREATE_DEFAULTS: dict[str, Any] = {
+    "calendar_index": 0,
+    "title": None,
+    "description": "",
+    "location": "",
+    "start_time": None,
+    "end_time": None,
+    "duration_hours": 1.0,
+    "reminders": None,
+    "attendees": None,
+    "categories": None,
+    "priority": None,
+    "recurrence": None,
+}
+
+
+def _list_calendars(client: CalDAVClient, arguments: Any) -> Any:  # noqa: ARG001
+    """List the available calendars."""
+    return client.list_calendars()
+
+
+def _create_event(client: CalDAVClient, arguments: Any) -> Any:
+    """Create an event, parsing its datetime arguments."""
+    args = {**_CREATE_DEFAULTS, **arguments}
+    start_time_str = args["start_time"]
+    end_time_str = args["end_time"]
+    start_time = _parse_datetime(start_time_str) if start_time_str else None
+    end_time = _parse_datetime(end_time_str) if end_time_str else None
+
+    # Parse recurrence until date if provided
+    recurrence = args["recurrence"]
+    if recurrence and recurrence.get("until"):
+        until_str = recurrence["until"]
+        try:
+            recurrence["until"] = _parse_datetime(until_str)
+        except ValueError:
+            # Try date format
+            with suppress(ValueError):
+                recurrence["until"] = datetime.fromisoformat(until_str).date()
+
+    return client.create_event(
+        calendar_index=args["calendar_index"],
+        title=args["title"],
+        description=args["description"],
+        location=args["location"],
+        start_time=start_time,
+        end_time=end_time,
+        duration_hours=args["duration_hours"],
+        reminders=args["reminders"],
+        attendees=args["attendees"],
+        categories=args["categories"],
+        priority=args["priority"],
+        recurrence=recurrence,
+    )
+
+
+def _get_events(client: CalDAVClient, arguments: Any) -> Any:
+    """Get events in a date range."""
+    start_date_str = arguments.get("start_date")
+    end_date_str = arguments.get("end_date")
+    start_date = _parse_datetime(start_date_str) if start_date_str else None
+    end_date = _parse_datetime(end_date_str) if end_date_str else None
+    include_all_day = arguments.get("include_all_day", True)
+
+    calendar_indices = arguments.get("calendar_indices")
+    if calendar_indices:
+        return client.get_events_multi(
+            calendar_indices=calendar_indices,
+            start_date=start_date,
+            end_date=end_date,
+            include_all_day=include_all_day,
+        )
+    return client.get_events(
+        calendar_index=arguments.get("calendar_index", 0),
+        start_date=start_date,
+        end_date=end_date,
+        include_all_day=include_all_day,
+    )
+
+
+def _get_today_events(client: CalDAVClient, arguments: Any) -> Any:
+    """Get today's events."""
+    return client.get_today_events(calendar_index=arguments.get("calendar_index", 0))
+
+
+def _get_week_events(client: CalDAVClient, arguments: Any) -> Any:
+    """Get this week's events."""
+    return client.get_week_events(
+        calendar_index=arguments.get("calendar_index", 0),
+        start_from_today=arguments.get("start_from_today", True),
+    )
+
+
+def _get_event_by_uid(client: CalDAVClient, arguments: Any) -> Any:
+    """Get a single event by UID."""
+    uid = arguments.get("uid")
+    event = client.get_event_by_uid(
+        uid=uid, calendar_index=arguments.get("calendar_index", 0)
+    )
+    if not event:
+        return {"error": f"Event with UID {uid} not found"}
+    return event
+
+
+def _delete_event(client: CalDAVClient, arguments: Any) -> Any:
+    """Delete an event by UID."""
+    return client.delete_event(
+        uid=arguments.get("uid"), calendar_index=arguments.get("calendar_index", 0)
+    )
+
+
+def _search_events(client: CalDAVClient, arguments: Any) -> Any:
+    """Search events within a required date range."""
+    start_date_str = arguments.get("start_date")
+    end_date_str = arguments.get("end_date")
+    if not start_date_str or not end_date_str:
+        raise ValueError(
+            "caldav_search_events requires both start_date and end_date arguments."
+        )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(events, indent=2, ensure_ascii=False),
-                )
-            ]
+    return client.search_events(
+        calendar_index=arguments.get("calendar_index", 0),
+        query=arguments.get("query"),
+        search_fields=arguments.get("search_fields"),
+        start_date=_parse_datetime(start_date_str),
+        end_date=_parse_datetime(end_date_str),
+    )
+
+
+@functools.cache
+def _unconfigured_response() -> Sequence[TextContent]:
+    """Build the error returned by every tool call when CalDAV isn't set up.
+
+    It depends only on the (cached) configuration, so it is built once.
+    """
+    missing = _missing_vars(get_caldav_config())
+    message = "CalDAV client not configured."
+    if missing:
+        message += f" Missing variables: {', '.join(missing)}."
+    else:
+        message += " Please configure CALDAV_URL, CALDAV_USERNAME, and CALDAV_PASSWORD."
 
-        elif name == "caldav_get_event_by_uid":
-            uid = arguments.get("uid")
-            calendar_index = arguments.get("calendar_index", 0)
+    return (
+        TextContent(
+            type="text",
+            text=_dump({"error": message}),
+        ),
+    )
+
+
+# Tool name -> handler returning the JSON-serializable tool result
+_HANDLERS: dict[str, Callable[[CalDAVClient, Any], Any]] = {
+    "caldav_list_calendars": _list_calendars,
+    "caldav_create_event": _create_event,
+    "caldav_get_events": _get_events,
+    "caldav_get_today_events": _get_today_events,
+    "caldav_get_week_events": _get_week_events,
+    "caldav_get_event_by_uid": _get_event_by_uid,
+    "caldav_delete_event": _delete_event,
+    "caldav_search_events": _search_events,
+}
+
+
+@app.call_tool(validate_input=False)
+async def call_tool(
+    name: str, arguments: Any
+) -> Sequence[TextContent] | CallToolResult:
+    """Handle tool calls for CalDAV operations."""
+    ctx = app.request_context.lifespan_context
 
-            event = ctx.client.get_event_by_uid(uid=uid, calendar_index=calendar_index)
+    if not ctx or not ctx.client:
+        return _unconfigured_response()
 
-            if event:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(event, indent=2, ensure_ascii=False),
-                    )
-                ]
-            else:
-                return [
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        result: Any = {"error": f"Unknown tool: {name}"}
+    else:
+        error = best_match(_VALIDATORS[name].iter_errors(arguments))
+        if error is not None:
+            # Same result the framework's own validation would return
+            return CallToolResult(
+                content=[
                     TextContent(
                         type="text",
-                        text=json.dumps(
-                            {"error": f"Event with UID {uid} not found"}, indent=2
-                        ),
+                        text=f"Input validation error: {error.message}",
                     )
-                ]
-
-        elif name == "caldav_delete_event":
-            uid = arguments.get("uid")
-            calendar_index = arguments.get("calendar_index", 0)
-
-            result = ctx.client.delete_event(uid=uid, calendar_index=calendar_index)
-
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2, ensure_ascii=False),
-                )
-            ]
-
-        elif name == "caldav_search_events":
-            calendar_index = arguments.get("calendar_index", 0)
-            query = arguments.get("query")
-            search_fields = arguments.get("search_fields")
-            start_date_str = arguments.get("start_date")
-            end_date_str = arguments.get("end_date")
-
-            if not start_date_str or not end_date_str:
-                raise ValueError(
-                    "caldav_search_events requires both start_date and end_date arguments."
-                )
-
-            start_date = None
-            if start_date_str:
-                start_date = datetime.fromisoformat(
-                    start_date_str.replace("Z", "+00:00")
-                )
-
-            end_date = None
-            if end_date_str:
-                end_date = datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
-
-            events = ctx.client.search_events(
-                calendar_index=calendar_index,
-                query=query,
-                search_fields=search_fields,
-                start_date=start_date,
-                end_date=end_date,
+                ],
+                isError=True,
             )
-
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(events, indent=2, ensure_ascii=False),
-                )
-            ]
-
-        else:
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"error": f"Unknown tool: {name}"}, indent=2),
-                )
-            ]
-
-    except Exception as e:
-        logger.error(f"Error calling tool {name}: {e}", exc_info=True)
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps({"error": str(e)}, indent=2),
-            )
-        ]
+        try:
+            # CalDAV requests block; run them off the event loop so
+            # concurrent tool calls and SSE streams aren't held up
+            result = await asyncio.to_thread(handler, ctx.client, arguments)
+        except Exception as e:
+            logger.error("Error calling tool %s: %s", name, e, exc_info=True)
+            result = {"error": str(e)}
+
+    return [
+        TextContent(
+            type="text",
+            text=_dump(result),
+        )
+    ]
 
 
 async def run_server(transport: str = "stdio", port: int = 8000) -> None:
@@ -633,7 +697,7 @@ async def run_server(transport: str = "stdio", port: int = 8000) -> None:
                 )
 
         starlette_app = Starlette(
-            debug=True,
+            debug=False,
             routes=[
                 Route("/sse", endpoint=handle_sse),
                 Mount("/messages/", app=sse.handle_post_message),
@@ -642,7 +706,11 @@ async def run_server(transport: str = "stdio", port: int = 8000) -> None:
 
         import uvicorn
 
-        config = uvicorn.Config(starlette_app, host="0.0.0.0", port=port)
+        # The loop is already chosen by the CLI (uvloop when installed) and
+        # uvicorn picks httptools over h11 on its own when it is available
+        config = uvicorn.Config(
+            starlette_app, host="0.0.0.0", port=port, access_log=False
+        )
         server = uvicorn.Server(config)
         await server.serve()
     else:
@@ -1,12 +1,22 @@
 """Pytest configuration for MCP CalDAV tests."""
 
 from contextlib import contextmanager
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from mcp_caldav.client import CalDAVClient
-from mcp_caldav.server import AppContext
+from mcp_caldav.server import AppContext, _unconfigured_response, get_caldav_config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Re-read the configuration in each test, since tests may patch it."""
+    get_caldav_config.cache_clear()
+    _unconfigured_response.cache_clear()
+    yield
+    get_caldav_config.cache_clear()
+    _unconfigured_response.cache_clear()
 
 
 @pytest.fixture
@@ -51,6 +61,35 @@ def mock_caldav_client():
     return mock_client
 
 
+@pytest.fixture
+def mock_principal():
+    """Patch caldav.DAVClient with a principal that has one mock calendar."""
+    with patch("caldav.DAVClient") as mock_dav_client:
+        principal = mock_dav_client.return_value.principal.return_value
+        calendar = MagicMock()
+        calendar.name = "Test Calendar"
+        principal.calendars.return_value = [calendar]
+        yield principal
+
+
+@pytest.fixture
+def mock_calendar(mock_principal):
+    """The principal's mock calendar, at index 0."""
+    return mock_principal.calendars.return_value[0]
+
+
+@pytest.fixture
+def connected_client(mock_principal):
+    """Create a CalDAVClient connected to the mock principal."""
+    client = CalDAVClient(
+        url="https://caldav.yandex.ru/",
+        username="test@example.com",
+        password="test-password",
+    )
+    client.connect()
+    return client
+
+
 @pytest.fixture
 def app_context(mock_caldav_client):
     """Create an AppContext with mock client."""
@@ -0,0 +1,111 @@
+"""Unit tests for the mcp-caldav command line."""
+
+import os
+from unittest.mock import AsyncMock, patch
+
+import dotenv
+import pytest
+
+import mcp_caldav
+from mcp_caldav import _env_flag, main
+
+
+@pytest.fixture(autouse=True)
+def run_server():
+    """Mock run_server, with an empty environment and no parsed .env files."""
+    mcp_caldav._DOTENV_CACHE.clear()
+    with (
+        patch.dict(os.environ, {}, clear=True),
+        patch("mcp_caldav.server.run_server", new_callable=AsyncMock) as run,
+    ):
+        yield run
+    mcp_caldav._DOTENV_CACHE.clear()
+
+
+def test_main_cli_overrides_env_file(tmp_path, run_server):
+    """Test that command line options win over values from the .env file."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "CALDAV_URL=https://from-env.example.com/\n"
+        "CALDAV_USERNAME=env-user\n"
+        "CALDAV_PASSWORD=env-password\n"
+    )
+
+    main(
+        [
+            "--env-file",
+            str(env_file),
+            "--caldav-url",
+            "https://from-cli.example.com/",
+            "--transport",
+            "sse",
+            "--port",
+            "9000",
+        ]
+    )
+
+    assert os.environ["CALDAV_URL"] == "https://from-cli.example.com/"
+    assert os.environ["CALDAV_USERNAME"] == "env-user"
+    assert os.environ["CALDAV_PASSWORD"] == "env-password"
+    run_server.assert_awaited_once_with(transport="sse", port=9000)
+
+
+def test_main_missing_env_file(tmp_path, run_server):
+    """Test that a nonexistent --env-file is rejected."""
+    with pytest.raises(SystemExit):
+        main(["--env-file", str(tmp_path / "missing.env")])
+
+    run_server.assert_not_called()
+
+
+def test_main_reuses_parsed_env_file(tmp_path):
+    """Test that an unchanged .env file is parsed only once."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("CALDAV_URL=https://first.example.com/\n")
+
+    with patch("dotenv.dotenv_values", wraps=dotenv.dotenv_values) as parse:
+        main(["--env-file", str(env_file)])
+        del os.environ["CALDAV_URL"]
+        main(["--env-file", str(env_file)])
+        assert parse.call_count == 1
+        assert os.environ["CALDAV_URL"] == "https://first.example.com/"
+
+        # A modified file is parsed again
+        env_file.write_text("CALDAV_URL=https://second.example.com/\n")
+        mtime = os.stat(env_file).st_mtime + 10
+        os.utime(env_file, (mtime, mtime))
+        del os.environ["CALDAV_URL"]
+        main(["--env-file", str(env_file)])
+        assert parse.call_count == 2
+        assert os.environ["CALDAV_URL"] == "https://second.example.com/"
+
+
+def test_env_flag():
+    """Test the spellings accepted for boolean environment flags."""
+    for value in ("true", "TRUE", "tRuE", " yes ", "1"):
+        os.environ["MCP_VERBOSE"] = value
+        assert _env_flag("MCP_VERBOSE"), value
+    for value in ("", "0", "false", "y", "t", "on"):
+        os.environ["MCP_VERBOSE"] = value
+        assert not _env_flag("MCP_VERBOSE"), value
+
+
+def test_main_loads_default_env_file_with_credentials_set(tmp_path):
+    """Test the default .env still supplies settings besides the credentials."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "CALDAV_URL=https://from-env.example.com/\nCALDAV_CACHE_DIR=/tmp/caldav\n"
+    )
+    os.environ.update(
+        {
+            "CALDAV_URL": "https://preset.example.com/",
+            "CALDAV_USERNAME": "user",
+            "CALDAV_PASSWORD": "password",
+        }
+    )
+
+    with patch("mcp_caldav._default_dotenv_path", str(env_file)):
+        main([])
+
+    assert os.environ["CALDAV_CACHE_DIR"] == "/tmp/caldav"
+    assert os.environ["CALDAV_URL"] == "https://preset.example.com/"
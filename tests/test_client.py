@@ -1,21 +1,41 @@
 """Unit tests for CalDAV client."""
 
-from datetime import date, datetime
-from unittest.mock import MagicMock, patch
+import os
+import time
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+from caldav.lib.error import NotFoundError, ReportError
+from icalendar import Calendar, Event
+from lxml import etree
 
 from mcp_caldav.client import (
     CalDAVClient,
+    _component_to_record,
     _escape_ical_text,
+    _fold_ical_line,
     _format_attendees,
     _format_categories,
     _format_rrule,
     _parse_attendees,
     _parse_categories,
+    _parse_entries,
 )
 
 
+def make_event(uid="uid-1", start=datetime(2025, 1, 20, 9, 0), end=None, **props):
+    """Wrap a VEVENT in a mock calendar object, as returned by a search."""
+    component = Event()
+    component.add("uid", uid)
+    component.add("dtstart", start)
+    if end is not None:
+        component.add("dtend", end)
+    for name, value in props.items():
+        component.add(name, value)
+    return MagicMock(icalendar_component=component)
+
+
 def test_caldav_client_init():
     """Test CalDAV client initialization."""
     client = CalDAVClient(
@@ -31,7 +51,7 @@ def test_caldav_client_init():
     assert client.principal is None
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_connect(mock_dav_client):
     """Test CalDAV client connection."""
     mock_client_instance = MagicMock()
@@ -54,10 +74,11 @@ def test_caldav_client_connect(mock_dav_client):
         url="https://caldav.yandex.ru/",
         username="test@example.com",
         password="test-password",
+        timeout=120,
     )
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_connect_error(mock_dav_client):
     """Test CalDAV client connection error handling."""
     mock_dav_client.side_effect = Exception("Connection failed")
@@ -74,7 +95,48 @@ def test_caldav_client_connect_error(mock_dav_client):
     assert "Connection failed" in str(exc_info.value)
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
+def test_caldav_client_close(mock_dav_client):
+    """Test closing the client releases the DAV session."""
+    mock_client_instance = MagicMock()
+    mock_dav_client.return_value = mock_client_instance
+
+    client = CalDAVClient(
+        url="https://caldav.yandex.ru/",
+        username="test@example.com",
+        password="test-password",
+    )
+    client.connect()
+    client.close()
+
+    mock_client_instance.close.assert_called_once()
+    assert client.client is None
+    assert client.principal is None
+
+    # Closing twice is a no-op
+    client.close()
+    mock_client_instance.close.assert_called_once()
+
+
+@patch("caldav.DAVClient")
+def test_caldav_client_context_manager(mock_dav_client):
+    """Test the client connects on enter, pools connections and closes on exit."""
+    mock_client_instance = MagicMock()
+    mock_dav_client.return_value = mock_client_instance
+
+    with CalDAVClient(
+        url="https://caldav.yandex.ru/",
+        username="test@example.com",
+        password="test-password",
+    ) as client:
+        assert client.principal is not None
+        assert mock_client_instance.session.mount.call_count == 2
+
+    mock_client_instance.close.assert_called_once()
+    assert client.client is None
+
+
+@patch("caldav.DAVClient")
 def test_caldav_client_list_calendars(mock_dav_client):
     """Test listing calendars."""
     mock_client_instance = MagicMock()
@@ -104,8 +166,19 @@ def test_caldav_client_list_calendars(mock_dav_client):
     assert calendars[1]["index"] == 1
     assert calendars[1]["name"] == "Calendar 2"
 
+    # The calendar list is reused within the TTL
+    client.list_calendars()
+    mock_principal.calendars.assert_called_once()
+    client._get_calendars(ttl=0)
+    assert mock_principal.calendars.call_count == 2
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+    # A zero TTL lists calendars on every call
+    client.calendars_ttl = 0
+    client.list_calendars()
+    assert mock_principal.calendars.call_count == 3
+
+
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event(mock_dav_client):
     """Test creating an event."""
     mock_client_instance = MagicMock()
@@ -140,9 +213,14 @@ def test_caldav_client_create_event(mock_dav_client):
     assert "uid" in result
     assert result["calendar"] == "Test Calendar"
     mock_calendar.save_event.assert_called_once()
+    assert f"UID:{result['uid']}\r\n" in mock_calendar.save_event.call_args[0][0]
+
+    # Events created back to back get distinct UIDs
+    second = client.create_event(title="Test Event", start_time=start_time)
+    assert second["uid"] != result["uid"]
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_with_reminders(mock_dav_client):
     """Test creating an event with reminders."""
     mock_client_instance = MagicMock()
@@ -180,9 +258,11 @@ def test_caldav_client_create_event_with_reminders(mock_dav_client):
     assert "VALARM" in saved_event
     assert "TRIGGER:-PT15M" in saved_event
     assert "TRIGGER:-PT60M" in saved_event
+    assert saved_event.endswith("END:VEVENT\r\nEND:VCALENDAR\r\n")
+    assert "\n" not in saved_event.replace("\r\n", "")
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_with_attendees(mock_dav_client):
     """Test creating an event with attendees."""
     mock_client_instance = MagicMock()
@@ -229,6 +309,7 @@ def test_escape_ical_text():
     assert _escape_ical_text("text;with;semicolons") == "text\\;with\\;semicolons"
     assert _escape_ical_text("text\nwith\nnewlines") == "text\\nwith\\nnewlines"
     assert _escape_ical_text("text\\with\\backslashes") == "text\\\\with\\\\backslashes"
+    assert _escape_ical_text("windows\r\nline") == "windows\\nline"
     assert (
         _escape_ical_text("complex,text;with\nall\\chars")
         == "complex\\,text\\;with\\nall\\\\chars"
@@ -237,6 +318,24 @@ def test_escape_ical_text():
     assert _escape_ical_text(123) == "123"  # Non-string input
 
 
+def test_fold_ical_line():
+    """Test folding long iCalendar content lines."""
+    assert _fold_ical_line("SUMMARY:short") == "SUMMARY:short"
+
+    line = "DESCRIPTION:" + "x" * 200
+    folded = _fold_ical_line(line)
+    physical = folded.split("\r\n")
+    assert all(len(p.encode("utf-8")) <= 75 for p in physical)
+    assert all(p.startswith(" ") for p in physical[1:])
+    assert "".join(p.removeprefix(" ") for p in physical) == line
+
+    # Multi-byte characters are never split across lines
+    line = "SUMMARY:" + "é" * 100
+    physical = _fold_ical_line(line).split("\r\n")
+    assert all(len(p.encode("utf-8")) <= 75 for p in physical)
+    assert "".join(p.removeprefix(" ") for p in physical) == line
+
+
 def test_format_rrule():
     """Test formatting recurrence rules."""
     # Basic daily
@@ -305,6 +404,7 @@ def test_format_categories():
     assert _format_categories(["Work", "Important"]) == "CATEGORIES:Work,Important"
     assert _format_categories(["Work,Project"]) == "CATEGORIES:Work\\,Project"
     assert _format_categories(["Work;Urgent"]) == "CATEGORIES:Work\\;Urgent"
+    assert _format_categories(["C:\\Temp"]) == "CATEGORIES:C:\\\\Temp"
     assert (
         _format_categories(["Work,Project", "Important"])
         == "CATEGORIES:Work\\,Project,Important"
@@ -408,6 +508,19 @@ def test_parse_categories():
     result = _parse_categories(mock_obj)
     assert len(result) == 2
 
+    # icalendar vCategory values, single and repeated properties
+    component = Event.from_ical(
+        "BEGIN:VEVENT\r\nCATEGORIES:Work,Project\r\nCATEGORIES:Urgent\r\nEND:VEVENT\r\n"
+    )
+    assert _parse_categories(component.get("CATEGORIES")) == [
+        "Work",
+        "Project",
+        "Urgent",
+    ]
+    component = Event()
+    component.add("categories", ["Work", "Important"])
+    assert _parse_categories(component.get("CATEGORIES")) == ["Work", "Important"]
+
     # Exception handling - function converts to string, so we get string representation
     result = _parse_categories(object())
     # Function tries to convert to string, so result may contain string representation
@@ -444,6 +557,16 @@ def test_parse_attendees():
     result = _parse_attendees(mock_component)
     assert len(result) == 2
 
+    # Parsed icalendar attendee, whose PARTSTAT is a plain string
+    component = Event.from_ical(
+        "BEGIN:VEVENT\r\n"
+        "ATTENDEE;PARTSTAT=TENTATIVE:mailto:user@example.com\r\n"
+        "END:VEVENT\r\n"
+    )
+    assert _parse_attendees(component) == [
+        {"email": "user@example.com", "status": "TENTATIVE"}
+    ]
+
     # String format (fallback)
     mock_component = MagicMock()
     mock_component.get.return_value = ["mailto:user@example.com"]
@@ -452,6 +575,10 @@ def test_parse_attendees():
     assert result[0]["email"] == "user@example.com"
     assert result[0]["status"] == "NEEDS-ACTION"
 
+    # The scheme is matched case-insensitively
+    mock_component.get.return_value = ["MAILTO:user@example.com"]
+    assert _parse_attendees(mock_component)[0]["email"] == "user@example.com"
+
     # Exception handling
     mock_attendee = MagicMock()
     mock_attendee.params = {}
@@ -462,10 +589,85 @@ def test_parse_attendees():
     assert result == []
 
 
+def test_component_to_record():
+    """Test converting a VEVENT component to an event record."""
+    component = Event()
+    component.add("uid", "test-uid-123")
+    component.add("summary", "Test Event")
+    component.add("dtstart", datetime(2025, 1, 20, 14, 0))
+    component.add("priority", 5)
+    component.add("categories", ["Work", "Meeting"])
+
+    record = _component_to_record(component)
+    assert record is not None
+    assert record["uid"] == "test-uid-123"
+    assert record["title"] == "Test Event"
+    assert record["start"] == "2025-01-20T14:00:00"
+    assert record["end"] == "2025-01-20T15:00:00"
+    assert record["description"] == ""
+    assert record["all_day"] is False
+    assert record["categories"] == ["Work", "Meeting"]
+    assert record["priority"] == 5
+    assert record["recurrence"] is None
+
+    # All-day event, UID taken from the fallback
+    component = Event()
+    component.add("dtstart", date(2025, 1, 20))
+    component.add("dtend", date(2025, 1, 21))
+    record = _component_to_record(component, "fallback-uid")
+    assert record is not None
+    assert record["uid"] == "fallback-uid"
+    assert record["all_day"] is True
+    assert record["start"] == "2025-01-20T00:00:00"
+
+    # Recurrence rules are returned as RRULE value text
+    component = Event.from_ical(
+        "BEGIN:VEVENT\r\n"
+        "DTSTART:20250120T140000\r\n"
+        "RRULE:FREQ=WEEKLY;BYDAY=MO,WE;COUNT=5\r\n"
+        "END:VEVENT\r\n"
+    )
+    record = _component_to_record(component)
+    assert record is not None
+    assert record["recurrence"] == "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=5"
+
+    component = Event.from_ical(
+        "BEGIN:VEVENT\r\n"
+        "DTSTART:20250120T140000\r\n"
+        "RRULE:FREQ=DAILY;UNTIL=20250131T000000Z\r\n"
+        "END:VEVENT\r\n"
+    )
+    record = _component_to_record(component)
+    assert record is not None
+    assert record["recurrence"] == "FREQ=DAILY;UNTIL=20250131T000000Z"
+
+    # No DTSTART
+    assert _component_to_record(Event()) is None
+
+
+def test_parse_entries_skips_bad_objects():
+    """Test unparsable and malformed objects are skipped, the rest sorted."""
+    unparsable = MagicMock()
+    type(unparsable).icalendar_component = PropertyMock(
+        side_effect=ValueError("bad data")
+    )
+    malformed = MagicMock(icalendar_component={"DTSTART": object()})
+
+    entries = _parse_entries(
+        [
+            make_event("late", datetime(2025, 1, 20, 11, 0)),
+            unparsable,
+            malformed,
+            make_event("early", datetime(2025, 1, 20, 9, 0)),
+        ]
+    )
+    assert [entry[2]["uid"] for entry in entries] == ["early", "late"]
+
+
 # Additional client method tests
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_with_categories_and_priority(mock_dav_client):
     """Test creating event with categories and priority."""
     mock_client_instance = MagicMock()
@@ -499,7 +701,7 @@ def test_caldav_client_create_event_with_categories_and_priority(mock_dav_client
     assert "PRIORITY:1" in saved_event
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_with_recurrence(mock_dav_client):
     """Test creating event with recurrence."""
     mock_client_instance = MagicMock()
@@ -533,7 +735,7 @@ def test_caldav_client_create_event_with_recurrence(mock_dav_client):
     assert "COUNT=5" in saved_event
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_with_attendees_dict(mock_dav_client):
     """Test creating event with attendees as dicts."""
     mock_client_instance = MagicMock()
@@ -570,7 +772,7 @@ def test_caldav_client_create_event_with_attendees_dict(mock_dav_client):
     assert "PARTSTAT=TENTATIVE" in saved_event
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_with_audio_reminder(mock_dav_client):
     """Test creating event with AUDIO reminder."""
     mock_client_instance = MagicMock()
@@ -604,7 +806,7 @@ def test_caldav_client_create_event_with_audio_reminder(mock_dav_client):
     assert "TRIGGER:-PT30M" in saved_event
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_with_escaped_text(mock_dav_client):
     """Test that special characters in text are escaped."""
     mock_client_instance = MagicMock()
@@ -642,7 +844,7 @@ def test_caldav_client_create_event_with_escaped_text(mock_dav_client):
     assert "Description" in saved_event
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_default_times(mock_dav_client):
     """Test creating event with default times."""
     mock_client_instance = MagicMock()
@@ -670,7 +872,7 @@ def test_caldav_client_create_event_default_times(mock_dav_client):
     assert "end_time" in result
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_invalid_calendar_index(mock_dav_client):
     """Test creating event with invalid calendar index."""
     mock_client_instance = MagicMock()
@@ -691,7 +893,7 @@ def test_caldav_client_create_event_invalid_calendar_index(mock_dav_client):
         client.create_event(calendar_index=1, title="Test Event")
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_create_event_not_connected(mock_dav_client):
     """Test creating event without connection."""
     client = CalDAVClient(
@@ -704,7 +906,7 @@ def test_caldav_client_create_event_not_connected(mock_dav_client):
         client.create_event(title="Test Event")
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_get_events(mock_dav_client):
     """Test getting events."""
     mock_client_instance = MagicMock()
@@ -738,7 +940,7 @@ def test_caldav_client_get_events(mock_dav_client):
     mock_component.get = get_component
     mock_event.icalendar_component = mock_component
 
-    mock_calendar.date_search.return_value = [mock_event]
+    mock_calendar.search.return_value = [mock_event]
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -764,7 +966,38 @@ def test_caldav_client_get_events(mock_dav_client):
     assert events[0]["uid"] == "test-uid-123"
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+def test_caldav_client_get_events_recurring(connected_client, mock_calendar):
+    """Test recurring events are expanded and keep their recurrence rule."""
+    from caldav.objects import Event as CalendarObject
+
+    recurring = CalendarObject(
+        url="https://caldav.example.com/cal/standup.ics",
+        data=(
+            "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:test\r\n"
+            "BEGIN:VEVENT\r\nUID:standup\r\nSUMMARY:Standup\r\n"
+            "DTSTART:20250118T090000\r\nDTEND:20250118T091500\r\n"
+            "RRULE:FREQ=DAILY;COUNT=10\r\nEND:VEVENT\r\n"
+            "BEGIN:VEVENT\r\nUID:standup\r\nSUMMARY:Standup (moved)\r\n"
+            "RECURRENCE-ID:20250121T090000\r\n"
+            "DTSTART:20250121T110000\r\nDTEND:20250121T111500\r\n"
+            "END:VEVENT\r\nEND:VCALENDAR\r\n"
+        ),
+    )
+    mock_calendar.search.return_value = [recurring]
+
+    events = connected_client.get_events(
+        0, datetime(2025, 1, 20), datetime(2025, 1, 22)
+    )
+
+    assert "expand" not in mock_calendar.search.call_args.kwargs
+    assert [(e["title"], e["start"]) for e in events] == [
+        ("Standup", "2025-01-20T09:00:00"),
+        ("Standup (moved)", "2025-01-21T11:00:00"),
+    ]
+    assert [e["recurrence"] for e in events] == ["FREQ=DAILY;COUNT=10"] * 2
+
+
+@patch("caldav.DAVClient")
 def test_caldav_client_get_events_all_day(mock_dav_client):
     """Test getting events with all-day event."""
     mock_client_instance = MagicMock()
@@ -796,7 +1029,7 @@ def test_caldav_client_get_events_all_day(mock_dav_client):
     mock_component.get = get_component
     mock_event.icalendar_component = mock_component
 
-    mock_calendar.date_search.return_value = [mock_event]
+    mock_calendar.search.return_value = [mock_event]
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -811,18 +1044,20 @@ def test_caldav_client_get_events_all_day(mock_dav_client):
     events = client.get_events(calendar_index=0, include_all_day=True)
     assert len(events) == 1
     assert events[0]["all_day"] is True
+    assert events[0]["start"] == "2025-01-20T00:00:00"
+    assert events[0]["end"] == "2025-01-21T23:59:59.999999"
 
     events = client.get_events(calendar_index=0, include_all_day=False)
     assert len(events) == 0
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_get_events_default_dates(mock_dav_client):
     """Test getting events with default dates."""
     mock_client_instance = MagicMock()
     mock_principal = MagicMock()
     mock_calendar = MagicMock()
-    mock_calendar.date_search.return_value = []
+    mock_calendar.search.return_value = []
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -836,16 +1071,16 @@ def test_caldav_client_get_events_default_dates(mock_dav_client):
 
     events = client.get_events(calendar_index=0)
     assert isinstance(events, list)
-    mock_calendar.date_search.assert_called_once()
+    mock_calendar.search.assert_called_once()
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_get_today_events(mock_dav_client):
     """Test getting today's events."""
     mock_client_instance = MagicMock()
     mock_principal = MagicMock()
     mock_calendar = MagicMock()
-    mock_calendar.date_search.return_value = []
+    mock_calendar.search.return_value = []
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -861,13 +1096,13 @@ def test_caldav_client_get_today_events(mock_dav_client):
     assert isinstance(events, list)
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_get_week_events(mock_dav_client):
     """Test getting week's events."""
     mock_client_instance = MagicMock()
     mock_principal = MagicMock()
     mock_calendar = MagicMock()
-    mock_calendar.date_search.return_value = []
+    mock_calendar.search.return_value = []
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -886,7 +1121,276 @@ def test_caldav_client_get_week_events(mock_dav_client):
     assert isinstance(events, list)
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+def test_caldav_client_get_events_cache(connected_client, mock_calendar):
+    """Test narrower windows are served from a cached wider window."""
+    client = connected_client
+    mock_calendar.search.return_value = [
+        make_event("tomorrow", datetime(2025, 1, 21, 9, 0), datetime(2025, 1, 21, 10)),
+        make_event("today", datetime(2025, 1, 20, 9, 0), datetime(2025, 1, 20, 10)),
+        make_event("all-day", date(2025, 1, 19), date(2025, 1, 20)),
+    ]
+
+    week = client.get_events(0, datetime(2025, 1, 19), datetime(2025, 1, 26))
+    assert [e["uid"] for e in week] == ["all-day", "today", "tomorrow"]
+
+    today = client.get_events(0, datetime(2025, 1, 20), datetime(2025, 1, 21))
+    assert [e["uid"] for e in today] == ["today"]
+    mock_calendar.search.assert_called_once()
+
+    # Writes invalidate the cache
+    client.create_event(title="New", start_time=datetime(2025, 1, 20, 12, 0))
+    client.get_events(0, datetime(2025, 1, 20), datetime(2025, 1, 21))
+    assert mock_calendar.search.call_count == 2
+
+    # Stale windows are served at once and refreshed in the background
+    key = (str(mock_calendar.url), datetime(2025, 1, 20), datetime(2025, 1, 21))
+    ts, entries = client._events_cache[key]
+    client._events_cache[key] = (ts - 60, entries)
+    with patch("mcp_caldav.client.threading.Thread") as mock_thread:
+        today = client.get_events(0, datetime(2025, 1, 20), datetime(2025, 1, 21))
+    assert today == [entry[2] for entry in entries]
+    assert mock_calendar.search.call_count == 2
+    mock_thread.assert_called_once()
+    assert mock_thread.call_args.kwargs["target"] == client._refresh_events
+    mock_thread.return_value.start.assert_called_once()
+
+
+def test_caldav_client_get_events_cache_local_time(
+    connected_client, mock_calendar, monkeypatch
+):
+    """Test cached windows are sliced in local time, like server queries."""
+    mock_calendar.search.return_value = [
+        make_event(
+            "late-utc",
+            datetime(2025, 1, 20, 23, 30, tzinfo=timezone.utc),
+            datetime(2025, 1, 21, 0, 30, tzinfo=timezone.utc),
+        ),
+        make_event(
+            "floating", datetime(2025, 1, 20, 23, 30), datetime(2025, 1, 21, 0, 30)
+        ),
+    ]
+
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    try:
+        connected_client.get_events(0, datetime(2025, 1, 19), datetime(2025, 1, 26))
+        # 23:30 UTC is 00:30 the next day in Berlin
+        today = connected_client.get_events(
+            0, datetime(2025, 1, 20), datetime(2025, 1, 21)
+        )
+        tomorrow = connected_client.get_events(
+            0, datetime(2025, 1, 21), datetime(2025, 1, 22)
+        )
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert [e["uid"] for e in today] == ["floating"]
+    assert sorted(e["uid"] for e in tomorrow) == ["floating", "late-utc"]
+    mock_calendar.search.assert_called_once()
+
+
+def test_caldav_client_refresh_calendar(connected_client, mock_calendar):
+    """Test sync-tokens keep cached windows of unchanged calendars."""
+    client = connected_client
+    mock_calendar.search.return_value = [make_event()]
+    mock_calendar.objects_by_sync_token.side_effect = [
+        MagicMock(sync_token="t1", __len__=lambda self: 0),
+        MagicMock(sync_token="t2", __len__=lambda self: 0),
+        MagicMock(sync_token="t3", __len__=lambda self: 1),
+    ]
+
+    start, end = datetime(2025, 1, 20), datetime(2025, 1, 21)
+    client.get_events(0, start, end)
+    key = (str(mock_calendar.url), start, end)
+
+    # The first check only primes the token
+    assert client.refresh_calendar(0) is True
+    assert key not in client._events_cache
+    client.get_events(0, start, end)
+
+    # Unchanged calendars keep their windows and get them re-stamped
+    ts, entries = client._events_cache[key]
+    client._events_cache[key] = (ts - 60, entries)
+    assert client.refresh_calendar(0) is False
+    assert client._events_cache[key][0] >= ts
+    mock_calendar.objects_by_sync_token.assert_called_with(sync_token="t1")
+
+    # Any change drops the cached windows
+    assert client.refresh_calendar(0) is True
+    assert key not in client._events_cache
+    assert mock_calendar.search.call_count == 2
+
+
+def test_caldav_client_refresh_drops_other_windows(connected_client, mock_calendar):
+    """Test a change seen refreshing one window drops the calendar's others."""
+    client = connected_client
+    mock_calendar.search.return_value = [make_event(summary="Old")]
+    mock_calendar.objects_by_sync_token.side_effect = [
+        MagicMock(sync_token="t1", __len__=lambda self: 0),
+        MagicMock(sync_token="t2", __len__=lambda self: 1),
+        MagicMock(sync_token="t2", __len__=lambda self: 0),
+    ]
+
+    # Prime the token, then cache two windows of the same calendar
+    client.refresh_calendar(0)
+    window_a = (datetime(2025, 1, 20), datetime(2025, 1, 21))
+    window_b = (datetime(2025, 1, 19), datetime(2025, 1, 26))
+    assert client.get_events(0, *window_a)[0]["title"] == "Old"
+    assert client.get_events(0, *window_b)[0]["title"] == "Old"
+
+    # The event changes on the server; refreshing window A sees it
+    mock_calendar.search.return_value = [make_event(summary="New")]
+    client._refresh_events(mock_calendar, *window_a)
+    assert client.get_events(0, *window_a)[0]["title"] == "New"
+
+    # Window B was dropped rather than kept (or re-stamped) with old data
+    key_b = (str(mock_calendar.url), *window_b)
+    assert key_b not in client._events_cache
+    client._refresh_events(mock_calendar, *window_a)
+    assert key_b not in client._events_cache
+    assert client.get_events(0, *window_b)[0]["title"] == "New"
+
+
+def test_caldav_client_refresh_failure_logged(connected_client, mock_calendar, caplog):
+    """Test a failed background refresh is logged and keeps the stale copy."""
+    mock_calendar.search.return_value = []
+    window = (datetime(2025, 1, 20), datetime(2025, 1, 21))
+    connected_client.get_events(0, *window)
+
+    mock_calendar.objects_by_sync_token.side_effect = ConnectionError("down")
+    with caplog.at_level("WARNING", logger="mcp-caldav"):
+        connected_client._refresh_events(mock_calendar, *window)
+
+    assert "Background refresh" in caplog.text
+    assert "down" in caplog.text
+    assert (str(mock_calendar.url), *window) in connected_client._events_cache
+
+
+def test_caldav_client_iter_events(connected_client, mock_calendar):
+    """Test iterating events lazily in start order."""
+    mock_calendar.search.return_value = [
+        make_event("second", datetime(2025, 1, 20, 11, 0)),
+        make_event("first", datetime(2025, 1, 20, 9, 0)),
+    ]
+
+    events = connected_client.iter_events(
+        0, datetime(2025, 1, 20), datetime(2025, 1, 21)
+    )
+    assert next(events)["uid"] == "first"
+    assert [e["uid"] for e in events] == ["second"]
+
+    # Errors surface on the call, not on first iteration
+    with pytest.raises(RuntimeError, match="Calendar index 1 not found"):
+        connected_client.iter_events(calendar_index=1)
+
+
+def test_caldav_client_disk_cache(mock_calendar, tmp_path):
+    """Test event windows saved on disk are served after a restart."""
+    mock_calendar.url = "https://caldav.example.com/calendars/test"
+    mock_calendar.search.return_value = [make_event()]
+
+    def make_client():
+        client = CalDAVClient(
+            url="https://caldav.example.com/",
+            username="test@example.com",
+            password="test-password",
+            cache_dir=str(tmp_path),
+        )
+        client.connect()
+        return client
+
+    # Other (old) files in the cache directory are never pruned
+    other = tmp_path / "notes.json"
+    other.write_text("{}")
+    os.utime(other, (0, 0))
+
+    start, end = datetime(2025, 1, 20), datetime(2025, 1, 21)
+    events = make_client().get_events(0, start, end)
+    (saved,) = [path for path in tmp_path.glob("*.json") if path != other]
+    assert saved.stat().st_mode & 0o777 == 0o600
+    assert other.exists()
+
+    # A new process serves the saved window and revalidates it
+    client = make_client()
+    with patch("mcp_caldav.client.threading.Thread") as mock_thread:
+        assert client.get_events(0, start, end) == events
+    mock_calendar.search.assert_called_once()
+    mock_thread.return_value.start.assert_called_once()
+
+    # A window saved under another sync-token than the calendar's is ignored
+    client = make_client()
+    client._sync_tokens[str(mock_calendar.url)] = "newer-token"
+    assert client._load_window(tmp_path, mock_calendar, start, end) is None
+
+    # Writes drop saved windows
+    client.create_event(title="New", start_time=datetime(2025, 1, 20, 12, 0))
+    assert list(tmp_path.glob("*.json")) == [other]
+
+
+def test_caldav_client_get_events_multiget(connected_client, mock_calendar):
+    """Test objects returned without data are loaded in one multiget."""
+    bare_event = MagicMock(data=None, url="https://caldav.example.com/1.ics")
+    loaded_event = make_event()
+    loaded_event.url = "https://caldav.example.com/1.ics"
+    mock_calendar.search.return_value = [bare_event]
+    mock_calendar.multiget.return_value = iter([loaded_event])
+
+    events = connected_client.get_events(
+        0, datetime(2025, 1, 20), datetime(2025, 1, 21)
+    )
+    assert [e["uid"] for e in events] == ["uid-1"]
+    mock_calendar.multiget.assert_called_once_with(["https://caldav.example.com/1.ics"])
+
+
+def test_caldav_client_get_events_multi(connected_client, mock_principal):
+    """Test fetching events from several calendars at once."""
+    client = connected_client
+    calendars = [MagicMock(), MagicMock()]
+    calendars[0].search.return_value = [make_event("late", datetime(2025, 1, 21, 9))]
+    calendars[1].search.return_value = [make_event("early", datetime(2025, 1, 20, 9))]
+    mock_principal.calendars.return_value = calendars
+
+    events = client.get_events_multi(
+        [0, 1], datetime(2025, 1, 20), datetime(2025, 1, 27)
+    )
+    assert [e["uid"] for e in events] == ["early", "late"]
+    for calendar in calendars:
+        calendar.search.assert_called_once()
+
+    # A write only drops the cached windows of the calendar written to
+    client.create_event(calendar_index=0, start_time=datetime(2025, 1, 22, 9, 0))
+    client.get_events_multi([0, 1], datetime(2025, 1, 20), datetime(2025, 1, 27))
+    assert calendars[0].search.call_count == 2
+    calendars[1].search.assert_called_once()
+
+    with pytest.raises(RuntimeError, match="Calendar index 2 not found"):
+        client.get_events_multi([0, 2])
+
+
+def test_caldav_client_get_busy_intervals(connected_client, mock_calendar):
+    """Test reading busy intervals from a free/busy report."""
+    mock_calendar.freebusy_request.return_value.icalendar_instance = Calendar.from_ical(
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VFREEBUSY\r\n"
+        "FREEBUSY:20250120T120000Z/PT1H,20250120T090000Z/20250120T100000Z\r\n"
+        "FREEBUSY;FBTYPE=FREE:20250120T140000Z/20250120T150000Z\r\n"
+        "END:VFREEBUSY\r\n"
+        "END:VCALENDAR\r\n"
+    )
+
+    start_date = datetime(2025, 1, 20)
+    end_date = datetime(2025, 1, 21)
+    intervals = connected_client.get_busy_intervals(0, start_date, end_date)
+
+    assert [(s.hour, e.hour) for s, e in intervals] == [(9, 10), (12, 13)]
+    mock_calendar.freebusy_request.assert_called_once_with(
+        start=start_date, end=end_date
+    )
+    mock_calendar.search.assert_not_called()
+
+
+@patch("caldav.DAVClient")
 def test_caldav_client_get_event_by_uid_found(mock_dav_client):
     """Test getting event by UID when found."""
     mock_client_instance = MagicMock()
@@ -917,7 +1421,7 @@ def test_caldav_client_get_event_by_uid_found(mock_dav_client):
     mock_component.get = get_component
     mock_event.icalendar_component = mock_component
 
-    mock_calendar.date_search.return_value = [mock_event]
+    mock_calendar.event_by_uid.return_value = mock_event
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -933,9 +1437,11 @@ def test_caldav_client_get_event_by_uid_found(mock_dav_client):
     assert event is not None
     assert event["uid"] == "test-uid-123"
     assert event["title"] == "Test Event"
+    mock_calendar.event_by_uid.assert_called_once_with("test-uid-123")
+    mock_calendar.date_search.assert_not_called()
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_get_event_by_uid_not_found(mock_dav_client):
     """Test getting event by UID when not found."""
     mock_client_instance = MagicMock()
@@ -958,6 +1464,7 @@ def test_caldav_client_get_event_by_uid_not_found(mock_dav_client):
     }.get(key)
     mock_event.icalendar_component = mock_component
 
+    mock_calendar.event_by_uid.side_effect = NotFoundError("not found")
     mock_calendar.date_search.return_value = [mock_event]
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
@@ -972,9 +1479,10 @@ def test_caldav_client_get_event_by_uid_not_found(mock_dav_client):
 
     event = client.get_event_by_uid("test-uid-123", calendar_index=0)
     assert event is None
+    mock_calendar.date_search.assert_called_once()
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_delete_event(mock_dav_client):
     """Test deleting an event."""
     mock_client_instance = MagicMock()
@@ -1005,7 +1513,7 @@ def test_caldav_client_delete_event(mock_dav_client):
     mock_component.get = get_component
     mock_event.icalendar_component = mock_component
 
-    mock_calendar.date_search.return_value = [mock_event]
+    mock_calendar.event_by_uid.return_value = mock_event
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -1023,7 +1531,7 @@ def test_caldav_client_delete_event(mock_dav_client):
     mock_event.delete.assert_called_once()
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_delete_event_not_found(mock_dav_client):
     """Test deleting an event that doesn't exist."""
     mock_client_instance = MagicMock()
@@ -1054,6 +1562,7 @@ def test_caldav_client_delete_event_not_found(mock_dav_client):
     mock_component.get = get_component
     mock_event.icalendar_component = mock_component
 
+    mock_calendar.event_by_uid.side_effect = NotFoundError("not found")
     mock_calendar.date_search.return_value = [mock_event]
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
@@ -1070,7 +1579,7 @@ def test_caldav_client_delete_event_not_found(mock_dav_client):
         client.delete_event("test-uid-123", calendar_index=0)
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_search_events(mock_dav_client):
     """Test searching events."""
     mock_client_instance = MagicMock()
@@ -1096,7 +1605,7 @@ def test_caldav_client_search_events(mock_dav_client):
             "CATEGORIES": None,
             "PRIORITY": None,
             "RRULE": None,
-            "ATTENDEE": [],
+            "ATTENDEE": ["mailto:John@Example.com"],
         }.get(key, default)
 
     mock_component1.get = get_component1
@@ -1126,7 +1635,8 @@ def test_caldav_client_search_events(mock_dav_client):
     mock_component2.get = get_component2
     mock_event2.icalendar_component = mock_component2
 
-    mock_calendar.date_search.return_value = [mock_event1, mock_event2]
+    # Server-side text-match is only a prefilter; results are re-checked
+    mock_calendar.search.return_value = [mock_event1, mock_event2]
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -1172,6 +1682,22 @@ def test_caldav_client_search_events(mock_dav_client):
         end_date=end_date,
     )
     assert len(results) == 1
+    assert mock_calendar.search.call_count == 3
+    (prop_filter,) = mock_calendar.search.call_args.kwargs["filters"]
+    xml = etree.tostring(prop_filter.xmlelement()).decode()
+    assert 'name="LOCATION"' in xml
+    assert 'collation="i;ascii-casemap"' in xml
+    assert ">Office<" in xml
+
+    # Non-ASCII queries can't be case-folded by the server; filter locally
+    client.search_events(
+        calendar_index=0,
+        query="Встреча",
+        search_fields=["title"],
+        start_date=start_date,
+        end_date=end_date,
+    )
+    assert "filters" not in mock_calendar.search.call_args.kwargs
 
     # Search without query (returns all)
     results = client.search_events(
@@ -1182,8 +1708,37 @@ def test_caldav_client_search_events(mock_dav_client):
     )
     assert len(results) == 2
 
+    # Servers rejecting text-match queries fall back to client-side filtering
+    client._events_cache.clear()
+
+    def reject_text_match(**kwargs):
+        if "filters" in kwargs:
+            raise ReportError("not implemented")
+        return [mock_event1, mock_event2]
+
+    mock_calendar.search.side_effect = reject_text_match
+    results = client.search_events(
+        calendar_index=0,
+        query="Meeting",
+        search_fields=["title"],
+        start_date=start_date,
+        end_date=end_date,
+    )
+    assert len(results) == 1
+    assert "filters" not in mock_calendar.search.call_args.kwargs
+
+    # Attendee emails match case-insensitively
+    results = client.search_events(
+        calendar_index=0,
+        query="JOHN@example",
+        search_fields=["attendees"],
+        start_date=start_date,
+        end_date=end_date,
+    )
+    assert [e["uid"] for e in results] == ["uid-1"]
+
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_search_events_missing_dates(mock_dav_client):
     """Test searching events without required dates."""
     mock_client_instance = MagicMock()
@@ -1211,7 +1766,7 @@ def test_caldav_client_search_events_missing_dates(mock_dav_client):
         client.search_events(calendar_index=0, query="test", start_date=datetime.now())
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_list_calendars_error(mock_dav_client):
     """Test list_calendars error handling."""
     mock_client_instance = MagicMock()
@@ -1231,13 +1786,13 @@ def test_caldav_client_list_calendars_error(mock_dav_client):
         client.list_calendars()
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_get_events_error(mock_dav_client):
     """Test get_events error handling."""
     mock_client_instance = MagicMock()
     mock_principal = MagicMock()
     mock_calendar = MagicMock()
-    mock_calendar.date_search.side_effect = Exception("Search error")
+    mock_calendar.search.side_effect = Exception("Search error")
     mock_principal.calendars.return_value = [mock_calendar]
     mock_client_instance.principal.return_value = mock_principal
     mock_dav_client.return_value = mock_client_instance
@@ -1253,7 +1808,7 @@ def test_caldav_client_get_events_error(mock_dav_client):
         client.get_events(calendar_index=0)
 
 
-@patch("mcp_caldav.client.caldav.DAVClient")
+@patch("caldav.DAVClient")
 def test_caldav_client_get_events_invalid_index(mock_dav_client):
     """Test get_events with invalid calendar index."""
     mock_client_instance = MagicMock()
@@ -1273,6 +1828,9 @@ def test_caldav_client_get_events_invalid_index(mock_dav_client):
     with pytest.raises(RuntimeError, match="Calendar index 1 not found"):
         client.get_events(calendar_index=1)
 
+    # A failed lookup drops the cached calendar list
+    assert client._calendars_cache is None
+
 
 def test_caldav_client_yandex_detection():
     """Test Yandex Calendar detection."""
@@ -1,6 +1,7 @@
 """Unit tests for MCP CalDAV server."""
 
 import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,6 +9,7 @@ from mcp.types import Tool
 
 from mcp_caldav.server import (
     AppContext,
+    _parse_datetime,
     call_tool,
     get_caldav_config,
     list_tools,
@@ -37,6 +39,8 @@ async def test_server_lifespan():
             assert ctx.client is not None
             mock_client.connect.assert_called_once()
 
+        mock_client.close.assert_called_once()
+
 
 @pytest.mark.anyio
 async def test_server_lifespan_no_credentials():
@@ -90,6 +94,59 @@ def test_get_caldav_config_yandex_env():
         assert config["password"] == "test-password"
 
 
+def test_get_caldav_config_calendar_cache_ttl():
+    """Test CALDAV_CALENDAR_CACHE_TTL is parsed, and bad values are ignored."""
+    with patch.dict("os.environ", {"CALDAV_CALENDAR_CACHE_TTL": "60"}):
+        assert get_caldav_config()["calendar_cache_ttl"] == 60.0
+
+    for value in ("soon", "-5", "nan", "inf"):
+        get_caldav_config.cache_clear()
+        with (
+            patch.dict("os.environ", {"CALDAV_CALENDAR_CACHE_TTL": value}),
+            patch("mcp_caldav.server.logger") as mock_logger,
+        ):
+            assert get_caldav_config()["calendar_cache_ttl"] is None
+        warning = mock_logger.warning.call_args[0]
+        assert "CALDAV_CALENDAR_CACHE_TTL" in warning[0]
+        assert warning[1] == value
+
+
+@pytest.mark.anyio
+async def test_server_lifespan_calendar_cache_ttl():
+    """Test the lifespan passes CALDAV_CALENDAR_CACHE_TTL to the client."""
+    with (
+        patch.dict(
+            "os.environ",
+            {
+                "CALDAV_URL": "https://caldav.example.com/",
+                "CALDAV_USERNAME": "test@example.com",
+                "CALDAV_PASSWORD": "test-password",
+                "CALDAV_CALENDAR_CACHE_TTL": "0",
+            },
+        ),
+        patch("mcp_caldav.server.CalDAVClient") as mock_client_cls,
+    ):
+        async with server_lifespan(MagicMock()):
+            pass
+
+    assert mock_client_cls.call_args.kwargs["calendars_ttl"] == 0.0
+
+
+def test_parse_datetime():
+    """Test parsing ISO 8601 tool arguments."""
+    assert _parse_datetime("2025-01-20T14:00:00Z") == datetime(
+        2025, 1, 20, 14, 0, tzinfo=timezone.utc
+    )
+    assert _parse_datetime("2025-01-20T14:00:00+03:00").utcoffset() == timedelta(
+        hours=3
+    )
+    assert _parse_datetime("2025-01-20T14:00:00") == datetime(2025, 1, 20, 14, 0)
+    assert _parse_datetime("2025-01-20") == datetime(2025, 1, 20)
+
+    with pytest.raises(ValueError):
+        _parse_datetime("tomorrow")
+
+
 @pytest.mark.anyio
 async def test_list_tools_with_client(app_context):
     """Test listing tools when client is available."""
@@ -282,6 +339,32 @@ async def test_call_tool_unknown_tool(app_context):
         assert "Unknown tool" in data["error"]
 
 
+@pytest.mark.anyio
+async def test_call_tool_invalid_arguments(app_context):
+    """Test that arguments are validated against the tool schema."""
+    from mcp.types import CallToolRequest, CallToolRequestParams
+
+    from mcp_caldav.server import app
+
+    from .conftest import mock_request_context
+
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="caldav_create_event", arguments={"start_time": "x"}
+        ),
+    )
+    with mock_request_context(app_context):
+        response = await app.request_handlers[CallToolRequest](request)
+
+    result = response.root
+    assert result.isError is True
+    assert result.content[0].text == (
+        "Input validation error: 'title' is a required property"
+    )
+    app_context.client.create_event.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_call_tool_error_handling(app_context):
     """Test error handling in tool calls."""
@@ -484,6 +567,26 @@ async def test_call_tool_get_events_with_dates(app_context):
         assert call_kwargs["end_date"] is not None
 
 
+@pytest.mark.anyio
+async def test_call_tool_get_events_several_calendars(app_context):
+    """Test caldav_get_events querying several calendars at once."""
+    from .conftest import mock_request_context
+
+    app_context.client.get_events_multi.return_value = [
+        {"uid": "uid-1", "title": "Event 1"},
+        {"uid": "uid-2", "title": "Event 2"},
+    ]
+
+    with mock_request_context(app_context):
+        result = await call_tool("caldav_get_events", {"calendar_indices": [0, 1]})
+
+        data = json.loads(result[0].text)
+        assert [event["uid"] for event in data] == ["uid-1", "uid-2"]
+        call_kwargs = app_context.client.get_events_multi.call_args[1]
+        assert call_kwargs["calendar_indices"] == [0, 1]
+        app_context.client.get_events.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_call_tool_get_week_events_start_from_monday(app_context):
     """Test calling caldav_get_week_events starting from Monday."""